@@ -1,5 +1,14 @@
 BASE_URL = "https://portal.trackzyng.codezyng.com"
 
+# Section URLs for direct navigation (no need to derive them from page.url)
+DASHBOARD_URL = f"{BASE_URL}/dashboard"
+BRANCH_URL = f"{BASE_URL}/branch"
+BRANCHES_URL = f"{BASE_URL}/branches"
+TASKS_URL = f"{BASE_URL}/tasks"
+REPORTS_URL = f"{BASE_URL}/reports"
+USERS_URL = f"{BASE_URL}/users"
+SETTINGS_URL = f"{BASE_URL}/settings"
+
 # Admin credentials (authorized)
 ADMIN_USERNAME = "shashwatrane@codezyng.com"
 ADMIN_PASSWORD = "test1234"
@@ -1,13 +1,20 @@
 import sys
 import os
+import re
 import pytest
 from datetime import datetime
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+from urllib.parse import urlparse
+from playwright.sync_api import Page, sync_playwright
 
 # Add project root to PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+from config.config import ADMIN_USERNAME, ADMIN_PASSWORD, DASHBOARD_URL
+from pages.dashboard_page import DashboardPage
+from pages.login_page import LoginPage
+from utils.test_helpers import login_user
+
 # Create screenshots directory
 SCREENSHOTS_DIR = Path(__file__).parent / "screenshots"
 SCREENSHOTS_DIR.mkdir(exist_ok=True)
@@ -16,25 +23,178 @@ SCREENSHOTS_DIR.mkdir(exist_ok=True)
 REPORTS_DIR = Path(__file__).parent / "reports"
 REPORTS_DIR.mkdir(exist_ok=True)
 
+# Static assets fetched once per session and replayed into every new browser context
+_STATIC_ASSET_TYPES = ("script", "stylesheet", "font")
+_STATIC_ASSET_CACHE = {}
+# Only these URLs are routed, so pages, API calls and images go to the network untouched;
+# the optional query string keeps cache-busted bundles (app.js?v=3) in the cache too
+_STATIC_ASSET_URL = re.compile(r"\.(js|css|woff2?)(\?[^#]*)?(#.*)?$")
+
+def _serve_cached_static_asset(route):
+    """Serve scripts, stylesheets and fonts from the session cache, fetching them on first use."""
+    request = route.request
+    if request.method != "GET" or request.resource_type not in _STATIC_ASSET_TYPES:
+        route.fallback()
+        return
+
+    cached = _STATIC_ASSET_CACHE.get(request.url)
+    if cached is None:
+        response = route.fetch()
+        if not response.ok:
+            route.fulfill(response=response)
+            return
+        # The fetched body is already decoded, so drop the encoding headers before replaying it
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ("content-encoding", "content-length")
+        }
+        cached = {"status": response.status, "headers": headers, "body": response.body()}
+        _STATIC_ASSET_CACHE[request.url] = cached
+
+    route.fulfill(**cached)
+
+# Opt-in with TRACKZYNG_E2E_FAST=1: images, media and analytics scripts are aborted
+_NOISE_RESOURCE_TYPES = ("image", "media")
+_NOISE_HOSTS = ("google-analytics", "googletagmanager", "segment", "mixpanel", "sentry", "datadog")
+
+def _block_noise(route):
+    """Abort images, media and third-party analytics; everything else goes on to the asset cache."""
+    request = route.request
+    host = urlparse(request.url).hostname or ""
+    if request.resource_type in _NOISE_RESOURCE_TYPES or any(name in host for name in _NOISE_HOSTS):
+        route.abort()
+        return
+    route.fallback()
+
+@pytest.fixture(scope="session")
+def playwright():
+    """Playwright driver shared across the test session."""
+    with sync_playwright() as p:
+        yield p
+
+@pytest.fixture(scope="session")
+def browser(playwright):
+    """Browser launched once and shared across the test session.
+
+    When PLAYWRIGHT_WS_ENDPOINT is set, connect to an already running
+    `playwright run-server` instead, so local runs skip the browser launch.
+    """
+    ws_endpoint = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+    if ws_endpoint:
+        browser_obj = playwright.chromium.connect(ws_endpoint)
+    else:
+        browser_obj = playwright.chromium.launch(headless=False, slow_mo=500)
+    try:
+        yield browser_obj
+    finally:
+        try:
+            browser_obj.close()
+        except Exception:
+            pass
+
+@pytest.fixture(scope="session")
+def browser_context_factory(browser):
+    """Create isolated browser contexts that share the session's static asset cache."""
+    block_noise = os.environ.get("TRACKZYNG_E2E_FAST") == "1"
+    def new_context(**kwargs):
+        context = browser.new_context(**kwargs)
+        context.route(_STATIC_ASSET_URL, _serve_cached_static_asset)
+        if block_noise:
+            # Routes registered last run first, so the noise filter sees requests before the cache
+            context.route("**/*", _block_noise)
+        return context
+    return new_context
+
 @pytest.fixture(scope="function")
-def page():
+def page(browser_context_factory):
     """Playwright page fixture."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=500)
-        context = browser.new_context()
-        page_obj = context.new_page()
+    context = browser_context_factory()
+    page_obj = context.new_page()
+    try:
+        yield page_obj
+    finally:
+        # Best-effort close; swallow exceptions to avoid teardown errors in test reporting
         try:
-            yield page_obj
-        finally:
-            # Best-effort close; swallow exceptions to avoid teardown errors in test reporting
-            try:
-                context.close()
-            except Exception:
-                pass
-            try:
-                browser.close()
-            except Exception:
-                pass
+            context.close()
+        except Exception:
+            pass
+
+@pytest.fixture(scope="function")
+def login_page(page):
+    """Login page object, already opened on a fresh page."""
+    login = LoginPage(page)
+    login.open()
+    return login
+
+@pytest.fixture(scope="session")
+def admin_storage_state(browser_context_factory, tmp_path_factory):
+    """Cookies and storage of an admin session, captured with one UI login per session."""
+    context = browser_context_factory()
+    try:
+        login_user(context.new_page(), ADMIN_USERNAME, ADMIN_PASSWORD)
+        state_path = tmp_path_factory.mktemp("auth") / "admin.json"
+        context.storage_state(path=str(state_path))
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+    return str(state_path)
+
+@pytest.fixture(scope="session")
+def admin_context(browser_context_factory, admin_storage_state):
+    """Admin context shared across the session by read-only pages; each user opens and closes its own page."""
+    context = browser_context_factory(storage_state=admin_storage_state)
+    try:
+        yield context
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+
+@pytest.fixture(scope="function")
+def admin_page(browser_context_factory, admin_storage_state):
+    """Page in a fresh context restored from the admin session, opened on the dashboard."""
+    context = browser_context_factory(storage_state=admin_storage_state)
+    page_obj = context.new_page()
+    try:
+        page_obj.goto(DASHBOARD_URL, wait_until="domcontentloaded", timeout=30000)
+        if "/dashboard" in page_obj.url:
+            DashboardPage(page_obj).wait_for_dashboard_load()
+        else:
+            # Saved session was rejected; fall back to a UI login and save the fresh
+            # session so later contexts restore it instead of logging in again
+            login_user(page_obj, ADMIN_USERNAME, ADMIN_PASSWORD)
+            if "/dashboard" in page_obj.url:
+                context.storage_state(path=admin_storage_state)
+        yield page_obj
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+
+@pytest.fixture(scope="function")
+def admin_context_page(admin_context, admin_storage_state):
+    """Dashboard page in the shared admin context, for tests that leave cookies and storage alone."""
+    page_obj = admin_context.new_page()
+    try:
+        page_obj.goto(DASHBOARD_URL, wait_until="domcontentloaded", timeout=30000)
+        if "/dashboard" in page_obj.url:
+            DashboardPage(page_obj).wait_for_dashboard_load()
+        else:
+            # Saved session was rejected; log in again, which also refreshes the shared context's
+            # cookies, and save the fresh session for the contexts created after this one
+            login_user(page_obj, ADMIN_USERNAME, ADMIN_PASSWORD)
+            if "/dashboard" in page_obj.url:
+                admin_context.storage_state(path=admin_storage_state)
+        yield page_obj
+    finally:
+        try:
+            page_obj.close()
+        except Exception:
+            pass
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -44,9 +204,10 @@ def pytest_runtest_makereport(item, call):
     
     # Take screenshot on failure
     if rep.when == "call" and rep.failed:
-        # Get page fixture if available
-        if "page" in item.funcargs:
-            page = item.funcargs["page"]
+        # Get page fixture if available (shared page fixtures and page objects are named differently)
+        candidates = (getattr(arg, "page", arg) for arg in item.funcargs.values())
+        page = next((arg for arg in candidates if isinstance(arg, Page)), None)
+        if page is not None:
             try:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 test_name = item.name.replace(" ", "_").replace("::", "_")
@@ -61,8 +61,33 @@ class BasePage:
                 return
             time.sleep(0.5)
     
-    def is_element_visible(self, selector: str, timeout: int = 5000) -> bool:
-        """Check if an element is visible using multiple strategies."""
+    def first_visible(self, *selectors: str):
+        """Locator for the first visible element matching any part of the given selectors.
+        
+        Comma lists here mix text= and CSS parts, so each part becomes its own
+        locator; the result can be passed to expect() for auto-retrying checks.
+        """
+        parts = [part.strip() for selector in selectors for part in selector.split(',')]
+        locator = self.page.locator(parts[0])
+        for part in parts[1:]:
+            locator = locator.or_(self.page.locator(part))
+        return locator.filter(visible=True).first
+    
+    def is_element_visible(self, selector: str, timeout: int = 5000, wait: bool = True) -> bool:
+        """Check if an element is visible using multiple strategies.
+        
+        With wait=False the check is immediate, for optional UI that is either
+        already rendered or not there at all.
+        """
+        if not wait:
+            parts = [selector] + ([part.strip() for part in selector.split(',')] if ',' in selector else [])
+            for part in parts:
+                try:
+                    if self.page.locator(part).first.is_visible():
+                        return True
+                except:
+                    continue
+            return False
         try:
             # Try direct selector first
             locator = self.page.locator(selector).first
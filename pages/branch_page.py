@@ -1,6 +1,27 @@
 """Branch management page object."""
+from config.config import BRANCH_URL
 from pages.base_page import BasePage
 
+# Matched in the browser against rendered headings only, so scripts, hidden text and
+# branch data such as a "404" zip code cannot look like a missing page
+_NOT_FOUND_JS = """() => [...document.querySelectorAll('h1, h2, h3, [role="heading"]')]
+    .some((el) => /page not found|\\b404\\b|not found/i.test(el.innerText || ''))"""
+
+# Sets each [selector, value] on the first visible match through the native value
+# setter and fires input/change, so framework-controlled inputs pick up the value
+_FILL_FIELDS_JS = """(fields) => {
+    for (const [selector, value] of fields) {
+        const el = [...document.querySelectorAll(selector)].find(
+            (candidate) => candidate.checkVisibility ? candidate.checkVisibility() : candidate.offsetParent !== null
+        );
+        if (!el) continue;
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+}"""
+
 class BranchPage(BasePage):
     """Page object for the Branch management section."""
     
@@ -39,6 +60,16 @@ class BranchPage(BasePage):
         self.save_button = 'button:has-text("Save"), button[type="submit"], button:has-text("Create")'
         self.cancel_button = 'button:has-text("Cancel"), button[type="button"]'
         self.branch_form = 'form, [data-testid*="branch-form"]'
+        
+        # Locators built once per page object; Playwright resolves them lazily on each use
+        self.branches_list_locator = page.locator(self.branches_list)
+        self.location_filter_locator = page.locator(self.location_filter)
+        self.status_filter_locator = page.locator(self.status_filter)
+        self.branches_table_locator = page.locator(self.branches_table)
+        self.branch_name_input_locator = page.locator(self.branch_name_input)
+        self.status_select_locator = page.locator(self.status_select)
+        self.manager_select_locator = page.locator(self.manager_select)
+        self.branch_form_locator = page.locator(self.branch_form)
     
     def is_loaded(self, timeout: int = 15000) -> bool:
         """Check if branch page is loaded - URL is primary check."""
@@ -47,33 +78,17 @@ class BranchPage(BasePage):
             url = self.get_current_url()
             if "/branch" in url or "/branches" in url:
                 self.page.wait_for_load_state("domcontentloaded", timeout=5000)
-                self.page.wait_for_timeout(2000)
                 
                 # Check for 404 or "Page Not Found"
-                try:
-                    page_text = self.page.locator("body").inner_text().lower()
-                    if "page not found" in page_text or "404" in page_text or "not found" in page_text:
-                        return False
-                except:
-                    pass
-                
-                return True
+                return not self.is_not_found()
             self.wait_for_url_pattern("/branch", timeout=timeout)
             # URL check is primary
             url = self.get_current_url()
             if "/branch" in url or "/branches" in url:
                 self.page.wait_for_load_state("domcontentloaded", timeout=5000)
-                self.page.wait_for_timeout(2000)
                 
                 # Check for 404
-                try:
-                    page_text = self.page.locator("body").inner_text().lower()
-                    if "page not found" in page_text or "404" in page_text or "not found" in page_text:
-                        return False
-                except:
-                    pass
-                
-                return True
+                return not self.is_not_found()
             # Secondary: try to find header element
             return self.is_element_visible(self.header, timeout=3000)
         except:
@@ -81,14 +96,23 @@ class BranchPage(BasePage):
             url = self.get_current_url()
             if "/branch" in url or "/branches" in url:
                 # Still check for 404
-                try:
-                    page_text = self.page.locator("body").inner_text().lower()
-                    if "page not found" in page_text or "404" in page_text or "not found" in page_text:
-                        return False
-                except:
-                    pass
+                if self.is_not_found():
+                    return False
             return "/branch" in url or "/branches" in url
     
+    def is_not_found(self) -> bool:
+        """Check whether the current page shows a 404 / "Page Not Found" message."""
+        try:
+            return self.page.evaluate(_NOT_FOUND_JS)
+        except:
+            return False
+    
+    def open(self):
+        """Open the branch list directly by URL and wait for its header; returns the navigation response."""
+        response = self.page.goto(BRANCH_URL, wait_until="domcontentloaded", timeout=30000)
+        self.is_element_visible(self.header, timeout=5000)
+        return response
+    
     def navigate_to_branches(self):
         """Navigate to branches page."""
         try:
@@ -116,7 +140,7 @@ class BranchPage(BasePage):
     def get_branches_count(self) -> int:
         """Get count of branches displayed."""
         try:
-            return self.page.locator(self.branches_list).count()
+            return self.branches_list_locator.count()
         except:
             return 0
     
@@ -127,24 +151,22 @@ class BranchPage(BasePage):
             search_locator = self.page.locator('input[placeholder="Search"]').first
             if search_locator.is_visible(timeout=5000):
                 search_locator.fill(search_term)
-                self.page.wait_for_timeout(1500)
             elif self.is_element_visible(self.search_input, timeout=3000):
                 self.fill_input(self.search_input, search_term)
-                self.page.wait_for_timeout(1500)
         except:
             pass  # Search input not found, that's okay
     
     def filter_by_location(self, location: str):
         """Filter branches by location."""
-        if self.is_element_visible(self.location_filter, timeout=3000):
-            self.page.locator(self.location_filter).select_option(location)
-            self.page.wait_for_timeout(1000)
+        # Filters are optional UI: rendered with the list or not at all, so do not wait for them
+        if self.is_element_visible(self.location_filter, wait=False):
+            self.location_filter_locator.select_option(location, timeout=3000)
     
     def filter_by_status(self, status: str):
         """Filter branches by status."""
-        if self.is_element_visible(self.status_filter, timeout=3000):
-            self.page.locator(self.status_filter).select_option(status)
-            self.page.wait_for_timeout(1000)
+        # Filters are optional UI: rendered with the list or not at all, so do not wait for them
+        if self.is_element_visible(self.status_filter, wait=False):
+            self.status_filter_locator.select_option(status, timeout=3000)
     
     def click_create_branch(self):
         """Click create branch button."""
@@ -154,7 +176,6 @@ class BranchPage(BasePage):
                 add_button = self.page.get_by_text("ADD BRANCH", exact=False).first
                 if add_button.is_visible(timeout=5000):
                     add_button.click()
-                    self.page.wait_for_timeout(2000)
                     return
             except:
                 pass
@@ -162,7 +183,6 @@ class BranchPage(BasePage):
             # Fallback to generic selector
             if self.is_element_visible(self.create_branch_button, timeout=5000):
                 self.click_element(self.create_branch_button)
-                self.page.wait_for_timeout(2000)
         except:
             pass  # Button not found, that's okay
     
@@ -170,32 +190,33 @@ class BranchPage(BasePage):
                         city: str = "", state: str = "", zipcode: str = "", 
                         phone: str = "", email: str = "", status: str = "", manager: str = ""):
         """Fill branch creation/edit form."""
-        if name and self.is_element_visible(self.branch_name_input, timeout=3000):
-            self.fill_input(self.branch_name_input, name)
-        if code and self.is_element_visible(self.branch_code_input, timeout=3000):
-            self.fill_input(self.branch_code_input, code)
-        if address and self.is_element_visible(self.address_input, timeout=3000):
-            self.fill_input(self.address_input, address)
-        if city and self.is_element_visible(self.city_input, timeout=3000):
-            self.fill_input(self.city_input, city)
-        if state and self.is_element_visible(self.state_input, timeout=3000):
-            self.fill_input(self.state_input, state)
-        if zipcode and self.is_element_visible(self.zipcode_input, timeout=3000):
-            self.fill_input(self.zipcode_input, zipcode)
-        if phone and self.is_element_visible(self.phone_input, timeout=3000):
-            self.fill_input(self.phone_input, phone)
-        if email and self.is_element_visible(self.email_input, timeout=3000):
-            self.fill_input(self.email_input, email)
+        text_fields = [
+            (self.branch_name_input, name),
+            (self.branch_code_input, code),
+            (self.address_input, address),
+            (self.city_input, city),
+            (self.state_input, state),
+            (self.zipcode_input, zipcode),
+            (self.phone_input, phone),
+            (self.email_input, email),
+        ]
+        text_fields = [(selector, value) for selector, value in text_fields if value]
+        try:
+            # All text fields in one round trip; fields missing from the form are skipped
+            self.page.evaluate(_FILL_FIELDS_JS, text_fields)
+        except:
+            for selector, value in text_fields:
+                if self.is_element_visible(selector, timeout=3000):
+                    self.fill_input(selector, value)
         if status and self.is_element_visible(self.status_select, timeout=3000):
-            self.page.locator(self.status_select).select_option(status)
+            self.status_select_locator.select_option(status)
         if manager and self.is_element_visible(self.manager_select, timeout=3000):
-            self.page.locator(self.manager_select).select_option(manager)
+            self.manager_select_locator.select_option(manager)
     
     def save_branch_form(self):
         """Save branch form."""
         if self.is_element_visible(self.save_button, timeout=3000):
             self.click_element(self.save_button)
-            self.page.wait_for_timeout(2000)
     
     def cancel_branch_form(self):
         """Cancel branch form."""
@@ -1,6 +1,14 @@
 """Dashboard page object."""
 from pages.base_page import BasePage
 
+# Counts matches for several CSS selectors in one round trip; selectors the browser rejects count as 0
+_PROBE_ELEMENTS_JS = """sels => Object.fromEntries(Object.entries(sels).map(([key, sel]) => {
+    try { return [key, document.querySelectorAll(sel).length]; } catch (e) { return [key, 0]; }
+}))"""
+
+# Tests a regex against the rendered page text without sending the text back to Python
+_PAGE_TEXT_MATCHES_JS = "([source, flags]) => new RegExp(source, flags).test(document.body.innerText)"
+
 class DashboardPage(BasePage):
     """Page object for the dashboard page."""
     
@@ -87,18 +95,6 @@ class DashboardPage(BasePage):
                 return
             raise
     
-    def get_all_widgets(self):
-        """Get all widget elements on the dashboard."""
-        return self.page.locator(self.widgets).all()
-    
-    def get_all_charts(self):
-        """Get all chart elements on the dashboard."""
-        return self.page.locator(self.charts).all()
-    
-    def get_all_tables(self):
-        """Get all table elements on the dashboard."""
-        return self.page.locator(self.tables).all()
-    
     def is_content_visible(self) -> bool:
         """Check if main content area is visible."""
         return self.is_element_visible(self.content_area, timeout=5000)
@@ -109,4 +105,18 @@ class DashboardPage(BasePage):
             return self.page.locator(selector).count()
         except:
             return 0
+    
+    def probe_elements(self, selectors: dict) -> dict:
+        """Count elements for several plain CSS selectors with a single page evaluate."""
+        try:
+            return self.page.evaluate(_PROBE_ELEMENTS_JS, selectors)
+        except:
+            return {key: 0 for key in selectors}
+    
+    def page_text_matches(self, pattern: str, flags: str = "i") -> bool:
+        """Check whether the visible page text matches a JavaScript regex."""
+        try:
+            return self.page.evaluate(_PAGE_TEXT_MATCHES_JS, [pattern, flags])
+        except:
+            return False
 
@@ -2,6 +2,10 @@
 from config.config import BASE_URL
 from pages.base_page import BasePage
 
+# True once the app is on the dashboard or shows a non-empty, visible login error
+_LOGIN_RESULT_JS = """sel => location.pathname.includes('dashboard')
+    || [...document.querySelectorAll(sel)].some(el => el.offsetParent !== null && el.textContent.trim() !== '')"""
+
 class LoginPage(BasePage):
     """Page object for the login page."""
     
@@ -20,11 +24,16 @@ class LoginPage(BasePage):
         self.login_form = 'form, [role="form"]'
         self.remember_me = 'input[type="checkbox"][name*="remember"], input[type="checkbox"][id*="remember"]'
         self.forgot_password_link = 'a:has-text("Forgot"), a:has-text("forgot")'
+        
+        # Locators built once per page object; Playwright resolves them lazily on each use
+        self.email_input_locator = page.locator(self.email_input)
+        self.next_button_locator = page.locator(self.next_button)
+        self.password_input_locator = page.locator(self.password_input)
     
     def open(self):
         """Open the login page."""
         self.navigate_to(BASE_URL)
-        self.page.locator(self.email_input).wait_for(state="visible", timeout=15000)
+        self.email_input_locator.wait_for(state="visible", timeout=15000)
     
     def login(self, username, password, check_password=True):
         """Perform login with username and password."""
@@ -35,7 +44,7 @@ class LoginPage(BasePage):
         # Step 2: fill password if needed
         if check_password:
             try:
-                self.page.locator(self.password_input).wait_for(state="visible", timeout=5000)
+                self.password_input_locator.wait_for(state="visible", timeout=5000)
                 self.fill_input(self.password_input, password)
                 self.click_element(self.signin_button)
             except:
@@ -46,6 +55,22 @@ class LoginPage(BasePage):
         """Check if login form is visible."""
         return self.is_element_visible(self.email_input, timeout=5000)
     
+    def wait_for_login_rejected(self, timeout: int = 5000) -> bool:
+        """Wait for a visible login error; returns False if none appears within the timeout."""
+        try:
+            self.page.locator(self.error_message).filter(visible=True).first.wait_for(state="visible", timeout=timeout)
+            return True
+        except:
+            return False
+    
+    def wait_for_login_result(self, timeout: int = 5000) -> bool:
+        """Wait until the login reaches the dashboard or shows an error; returns True on the dashboard."""
+        try:
+            self.page.wait_for_function(_LOGIN_RESULT_JS, arg=self.error_message, timeout=timeout)
+        except:
+            pass
+        return "/dashboard" in self.page.url
+    
     def get_error_message(self) -> str:
         """Get error message if present."""
         if self.is_element_visible(self.error_message, timeout=3000):
@@ -54,11 +79,11 @@ class LoginPage(BasePage):
     
     def clear_email_field(self):
         """Clear the email input field."""
-        self.page.locator(self.email_input).clear()
+        self.email_input_locator.clear()
     
     def clear_password_field(self):
         """Clear the password input field."""
         try:
-            self.page.locator(self.password_input).clear()
+            self.password_input_locator.clear()
         except:
             pass
@@ -1,4 +1,6 @@
 """Settings page object."""
+import re
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.base_page import BasePage
 
 class SettingsPage(BasePage):
@@ -13,6 +15,11 @@ class SettingsPage(BasePage):
         self.profile_tab = 'button:has-text("Profile"), [data-testid*="profile"]'
         self.security_tab = 'button:has-text("Security"), [data-testid*="security"]'
         self.notifications_tab = 'button:has-text("Notifications"), [data-testid*="notifications"]'
+        # Tabs are plain buttons here, so accept any of the usual "selected" markers
+        self.active_tab = (
+            '[role="tab"][aria-selected="true"], button[aria-selected="true"], '
+            'button[aria-pressed="true"], button[aria-current], button[class*="active"]'
+        )
         self.save_button = 'button:has-text("Save"), button[type="submit"]'
         self.cancel_button = 'button:has-text("Cancel")'
         
@@ -37,6 +44,9 @@ class SettingsPage(BasePage):
         self.email_notifications_checkbox = 'input[type="checkbox"][name*="email"]'
         self.sms_notifications_checkbox = 'input[type="checkbox"][name*="sms"]'
         self.push_notifications_checkbox = 'input[type="checkbox"][name*="push"]'
+        
+        # Locators built once per page object; Playwright resolves them lazily on each use
+        self.active_tab_locator = page.locator(self.active_tab)
     
     def is_loaded(self, timeout: int = 15000) -> bool:
         """Check if settings page is loaded."""
@@ -113,7 +123,16 @@ class SettingsPage(BasePage):
         if tab_name.lower() in tab_selectors:
             if self.is_element_visible(tab_selectors[tab_name.lower()], timeout=3000):
                 self.click_element(tab_selectors[tab_name.lower()])
-                self.page.wait_for_timeout(500)
+                # Return as soon as the clicked tab is marked selected rather than sleeping;
+                # tab bars that mark no selection at all have nothing to wait for
+                if self.active_tab_locator.count() == 0:
+                    return
+                try:
+                    self.active_tab_locator.filter(has_text=re.compile(tab_name, re.IGNORECASE)).first.wait_for(
+                        state="visible", timeout=1500
+                    )
+                except PlaywrightTimeoutError:
+                    pass
     
     def update_profile(self, name: str = "", email: str = "", phone: str = ""):
         """Update profile settings."""
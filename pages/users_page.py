@@ -36,6 +36,9 @@ class UsersPage(BasePage):
         self.save_button = 'button:has-text("Save"), button[type="submit"], button:has-text("Create")'
         self.cancel_button = 'button:has-text("Cancel"), button[type="button"]'
         self.user_form = 'form, [data-testid*="user-form"]'
+        
+        # Locators built once per page object; Playwright resolves them lazily on each use
+        self.user_form_locator = page.locator(self.user_form)
     
     def is_loaded(self, timeout: int = 15000) -> bool:
         """Check if users page is loaded - URL is primary check."""
@@ -1,388 +1,364 @@
 """Accessibility tests."""
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, expect
 from pages.login_page import LoginPage
-from config.config import ADMIN_USERNAME, ADMIN_PASSWORD
-from utils.test_helpers import ensure_fresh_session, login_user
 
-class TestAccessibility:
-    """Accessibility test suite."""
-    
-    def test_keyboard_navigation(self, page):
-        """Test keyboard navigation."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
-        # Get initial focused element
-        initial_focus = page.evaluate("() => document.activeElement?.tagName || null")
-        
-        # Tab through elements
-        page.keyboard.press("Tab")
-        page.wait_for_timeout(500)
-        focus_after_first_tab = page.evaluate("() => document.activeElement?.tagName || null")
-        
-        page.keyboard.press("Tab")
-        page.wait_for_timeout(500)
-        focus_after_second_tab = page.evaluate("() => document.activeElement?.tagName || null")
-        
-        # Verify that focus actually changed (keyboard navigation is working)
-        # At least one tab should change focus, or we should have focusable elements
-        focus_changed = (initial_focus != focus_after_first_tab) or (focus_after_first_tab != focus_after_second_tab)
-        has_focusable_elements = page.locator("input, button, a, [tabindex]").count() > 0
-        
-        assert focus_changed or has_focusable_elements, \
-            f"Keyboard navigation should work - focus should change when tabbing (initial: {initial_focus}, after 1st tab: {focus_after_first_tab}, after 2nd tab: {focus_after_second_tab})"
-    
-    def test_aria_labels(self, page):
-        """Test ARIA labels on interactive elements."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
-        # Check for ARIA labels on buttons
-        buttons = page.locator("button").all()
-        buttons_with_labels = 0
-        buttons_with_text = 0
-        
-        for button in buttons[:5]:  # Check first 5 buttons
-            aria_label = button.get_attribute("aria-label")
-            button_text = button.inner_text().strip()
-            
-            if aria_label and len(aria_label) > 0:
-                buttons_with_labels += 1
-            if button_text and len(button_text) > 0:
-                buttons_with_text += 1
-        
-        # Buttons should have either aria-label OR visible text for accessibility
-        total_buttons_checked = min(len(buttons), 5)
-        accessible_buttons = buttons_with_labels + buttons_with_text
-        
-        # At least some buttons should be accessible (have label or text)
-        # For login page, we expect at least the Next/Sign in button to have text
-        assert accessible_buttons > 0 or total_buttons_checked == 0, \
-            f"Buttons should have accessible labels - checked {total_buttons_checked} buttons, {buttons_with_labels} have aria-label, {buttons_with_text} have text"
-    
-    def test_form_labels(self, page):
-        """Test form field labels."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
-        # Check if inputs have associated labels
-        inputs = page.locator("input").all()
-        inputs_with_labels = 0
-        inputs_with_aria = 0
-        inputs_with_placeholder = 0
-        
-        for inp in inputs:
-            # Check for associated label element
-            inp_id = inp.get_attribute("id")
-            if inp_id:
-                label = page.locator(f'label[for="{inp_id}"]').count()
-                if label > 0:
-                    inputs_with_labels += 1
-            
-            # Check for aria-label
-            aria_label = inp.get_attribute("aria-label")
-            if aria_label and len(aria_label) > 0:
-                inputs_with_aria += 1
-            
-            # Check for placeholder (less ideal but provides context)
-            placeholder = inp.get_attribute("placeholder")
-            if placeholder and len(placeholder) > 0:
-                inputs_with_placeholder += 1
-        
-        total_inputs = len(inputs)
-        accessible_inputs = inputs_with_labels + inputs_with_aria
-        
-        # Inputs should have labels for accessibility
-        # Placeholder is acceptable as fallback but not ideal
-        assert accessible_inputs > 0 or (inputs_with_placeholder > 0 and total_inputs > 0) or total_inputs == 0, \
-            f"Form inputs should have labels - {total_inputs} inputs found, {inputs_with_labels} have <label>, {inputs_with_aria} have aria-label, {inputs_with_placeholder} have placeholder"
-    
-    def test_color_contrast(self, page):
-        """Test color contrast for readability."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        # Wait for page to load
-        try:
-            page.wait_for_load_state("domcontentloaded", timeout=10000)
-            page.wait_for_timeout(2000)
-        except:
-            pass  # Page might already be loaded
-        
-        # Check that page loaded successfully (URL and title are indicators)
-        page_loaded = False
-        try:
-            url = page.url
-            title = page.title()
-            page_loaded = (url.startswith("http") and len(title) > 0)
-        except:
-            pass
-        
-        # Check for any content on the page - multiple strategies
-        has_content = False
-        
-        # Strategy 1: Check for input elements (login page should have these)
-        try:
-            inputs = page.locator("input").count()
-            if inputs > 0:
-                has_content = True
-        except:
-            pass
-        
-        # Strategy 2: Check for buttons
-        if not has_content:
-            try:
-                buttons = page.locator("button").count()
-                if buttons > 0:
-                    has_content = True
-            except:
-                pass
-        
-        # Strategy 3: Check for any visible elements
-        if not has_content:
-            try:
-                visible_elements = page.locator("body *").count()
-                if visible_elements > 0:
-                    has_content = True
-            except:
-                pass
-        
-        # Strategy 4: Check page title as content indicator
-        if not has_content:
-            try:
-                if page.title() and len(page.title().strip()) > 0:
-                    has_content = True
-            except:
-                pass
-    
-        assert page_loaded or has_content, \
-            "Page should load successfully and have content for color contrast verification (actual contrast should be checked with accessibility tools)"
-    
-    def test_screen_reader_compatibility(self, page):
-        """Test screen reader compatibility."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        # Wait for page to load
-        try:
-            page.wait_for_load_state("domcontentloaded", timeout=10000)
-            page.wait_for_timeout(2000)
-        except:
-            pass  # Page might already be loaded
-        
-        # Check for semantic HTML elements
-        headings = 0
-        landmarks = 0
-        aria_landmarks = 0
-        forms = 0
-        inputs = 0
-        buttons = 0
-        labels = 0
-        
-        try:
-            headings = page.locator("h1, h2, h3, h4, h5, h6").count()
-        except:
-            pass
-        
-        try:
-            landmarks = page.locator("nav, main, header, footer, aside, section, article").count()
-        except:
-            pass
-        
-        try:
-            aria_landmarks = page.locator('[role="navigation"], [role="main"], [role="banner"], [role="contentinfo"]').count()
-        except:
-            pass
-        
-        try:
-            forms = page.locator("form").count()
-        except:
-            pass
-        
-        try:
-            inputs = page.locator("input, select, textarea").count()
-        except:
-            pass
-        
+# Keywords that indicate an error message is rendered on the page
+_ERROR_KEYWORDS = ("error", "invalid", "incorrect", "wrong", "failed")
+_ERROR_KEYWORDS_PATTERN = "|".join(_ERROR_KEYWORDS)
+
+# Elements that announce an error to assistive technology
+_ERROR_ELEMENTS = '[role="alert"], .error, [aria-live], [class*="error" i], [class*="alert" i]'
+
+# Tag name of the focused element once the next frame has rendered
+_ACTIVE_TAG_AFTER_FRAME_JS = """
+    async () => {
+        await new Promise(resolve => requestAnimationFrame(resolve));
+        return document.activeElement?.tagName || null;
+    }
+"""
+
+# Installed into every page of the shared context: waits a frame for focus to
+# settle, then describes the focused element and its focus styles
+_FOCUS_INFO_INIT_SCRIPT = """
+    window.__a11yFocusInfo = async () => {
+        await new Promise(resolve => requestAnimationFrame(resolve));
+        const el = document.activeElement;
+        if (!el) return null;
+        const style = window.getComputedStyle(el);
+        return {
+            tag: el.tagName.toLowerCase(),
+            outline: style.outline,
+            outlineWidth: style.outlineWidth,
+            outlineStyle: style.outlineStyle,
+            border: style.border,
+            boxShadow: style.boxShadow
+        };
+    };
+"""
+
+
+# Element counts and attributes read by the login page probes, collected in one round trip
+_ELEMENT_CENSUS_JS = """
+    () => {
+        const count = (selector) => document.querySelectorAll(selector).length;
+        const buttons = [...document.querySelectorAll('button')].slice(0, 5);
+        const inputs = [...document.querySelectorAll('input')];
+        const hasAttr = (el, name) => (el.getAttribute(name) || '').length > 0;
+        return {
+            url: location.href,
+            title: document.title,
+            lang: document.documentElement.getAttribute('lang'),
+            headings: count('h1, h2, h3, h4, h5, h6'),
+            landmarks: count('nav, main, header, footer, aside, section, article'),
+            aria_landmarks: count('[role="navigation"], [role="main"], [role="banner"], [role="contentinfo"]'),
+            forms: count('form'),
+            form_controls: count('input, select, textarea'),
+            buttons: count("button, [role='button']"),
+            labels: count('label'),
+            inputs: count('input'),
+            plain_buttons: count('button'),
+            elements: count('body *'),
+            focusable: count('input, button, a, [tabindex]'),
+            skip_links: count('a[href*="#main"], a[href*="#content"], a[href*="#skip"]'),
+            page_complexity: count('nav, header, footer, aside'),
+            buttons_checked: buttons.length,
+            buttons_with_aria_label: buttons.filter(b => hasAttr(b, 'aria-label')).length,
+            buttons_with_text: buttons.filter(b => b.textContent.trim().length > 0).length,
+            inputs_with_label: inputs.filter(i => i.id && document.querySelector(`label[for="${CSS.escape(i.id)}"]`)).length,
+            inputs_with_aria_label: inputs.filter(i => hasAttr(i, 'aria-label')).length,
+            inputs_with_placeholder: inputs.filter(i => hasAttr(i, 'placeholder')).length,
+        };
+    }
+"""
+
+# Census reported when the page cannot be read; every count is zero
+_EMPTY_CENSUS = {
+    "url": "",
+    "title": "",
+    "lang": None,
+    **dict.fromkeys(
+        ["headings", "landmarks", "aria_landmarks", "forms", "form_controls", "buttons", "labels",
+         "inputs", "plain_buttons", "elements", "focusable", "skip_links", "page_complexity",
+         "buttons_checked", "buttons_with_aria_label", "buttons_with_text",
+         "inputs_with_label", "inputs_with_aria_label", "inputs_with_placeholder"],
+        0,
+    ),
+}
+
+
+# Read-only probes run against the shared login page and its element census.
+# Each returns (passed, message).
+
+def probe_keyboard_navigation(page, census):
+    """Keyboard navigation moves focus between elements."""
+    # Start from a neutral focus so probe order does not matter, and read the initial focus
+    initial_focus = page.evaluate("() => { document.activeElement?.blur(); return document.activeElement?.tagName || null; }")
+
+    # Tab through elements; each read waits a frame for focus to settle instead of sleeping
+    page.keyboard.press("Tab")
+    focus_after_first_tab = page.evaluate(_ACTIVE_TAG_AFTER_FRAME_JS)
+
+    page.keyboard.press("Tab")
+    focus_after_second_tab = page.evaluate(_ACTIVE_TAG_AFTER_FRAME_JS)
+
+    # Verify that focus actually changed (keyboard navigation is working)
+    # At least one tab should change focus, or we should have focusable elements
+    focus_changed = (initial_focus != focus_after_first_tab) or (focus_after_first_tab != focus_after_second_tab)
+    has_focusable_elements = census["focusable"] > 0
+
+    return focus_changed or has_focusable_elements, \
+        f"Keyboard navigation should work - focus should change when tabbing (initial: {initial_focus}, after 1st tab: {focus_after_first_tab}, after 2nd tab: {focus_after_second_tab})"
+
+def probe_aria_labels(page, census):
+    """Interactive elements have ARIA labels or text."""
+    # The census checks the first 5 buttons for an aria-label or text
+    buttons_with_labels = census["buttons_with_aria_label"]
+    buttons_with_text = census["buttons_with_text"]
+
+    # Buttons should have either aria-label OR visible text for accessibility
+    total_buttons_checked = census["buttons_checked"]
+    accessible_buttons = buttons_with_labels + buttons_with_text
+
+    # At least some buttons should be accessible (have label or text)
+    # For login page, we expect at least the Next/Sign in button to have text
+    return accessible_buttons > 0 or total_buttons_checked == 0, \
+        f"Buttons should have accessible labels - checked {total_buttons_checked} buttons, {buttons_with_labels} have aria-label, {buttons_with_text} have text"
+
+def probe_form_labels(page, census):
+    """Form fields have labels."""
+    # Inputs with an associated <label>, an aria-label, or a placeholder
+    inputs_with_labels = census["inputs_with_label"]
+    inputs_with_aria = census["inputs_with_aria_label"]
+    inputs_with_placeholder = census["inputs_with_placeholder"]
+
+    total_inputs = census["inputs"]
+    accessible_inputs = inputs_with_labels + inputs_with_aria
+
+    # Inputs should have labels for accessibility
+    # Placeholder is acceptable as fallback but not ideal
+    return accessible_inputs > 0 or (inputs_with_placeholder > 0 and total_inputs > 0) or total_inputs == 0, \
+        f"Form inputs should have labels - {total_inputs} inputs found, {inputs_with_labels} have <label>, {inputs_with_aria} have aria-label, {inputs_with_placeholder} have placeholder"
+
+def probe_color_contrast(page, census):
+    """Page renders content for color contrast verification."""
+    # Check that page loaded successfully (URL and title are indicators)
+    url = census["url"]
+    title = census["title"] or ""
+    page_loaded = url.startswith("http") and len(title) > 0
+
+    # Check for any content on the page - inputs, buttons, any elements, or a title
+    has_content = (
+        census["inputs"] > 0
+        or census["plain_buttons"] > 0
+        or census["elements"] > 0
+        or len(title.strip()) > 0
+    )
+
+    return page_loaded or has_content, \
+        "Page should load successfully and have content for color contrast verification (actual contrast should be checked with accessibility tools)"
+
+def probe_screen_reader_compatibility(page, census):
+    """Page exposes semantic structure for screen readers."""
+    # Check for semantic HTML elements
+    headings = census["headings"]
+    landmarks = census["landmarks"]
+    aria_landmarks = census["aria_landmarks"]
+    forms = census["forms"]
+    inputs = census["form_controls"]
+    buttons = census["buttons"]
+    labels = census["labels"]
+
+    has_semantic_structure = (headings > 0 or landmarks > 0 or aria_landmarks > 0)
+    has_form_structure = forms > 0
+    has_interactive_elements = (inputs > 0 or buttons > 0)
+    has_navigable_content = has_semantic_structure or has_form_structure or has_interactive_elements
+
+    # Additional check: page should have some structure (not just empty)
+    page_has_structure = (headings + landmarks + aria_landmarks + forms + inputs + buttons) > 0
+
+    return has_navigable_content and page_has_structure, \
+        f"Page should have semantic structure or interactive elements for screen readers - " \
+        f"headings: {headings}, landmarks: {landmarks}, aria: {aria_landmarks}, " \
+        f"forms: {forms}, inputs: {inputs}, buttons: {buttons}, labels: {labels}"
+
+def probe_focus_indication(page, census):
+    """Focused elements have a visible focus indicator."""
+    # Start from a neutral focus so probe order does not matter
+    page.evaluate("() => document.activeElement?.blur()")
+
+    # Tab to input, then read the focused element and its style with the preinstalled helper
+    page.keyboard.press("Tab")
+    focus_info = page.evaluate("() => window.__a11yFocusInfo()")
+
+    # Check if focused element exists and is focusable
+    if focus_info is None:
+        return False, "Focus should be visible - no element is focused"
+
+    # Focus should have some visible indicator (outline, border, or box-shadow)
+    outline_width = focus_info.get('outlineWidth', '0px')
+    has_outline = outline_width and outline_width != '0px'
+    border = focus_info.get('border', '')
+    has_border = border and '0px' not in border
+    box_shadow = focus_info.get('boxShadow', 'none')
+    has_shadow = box_shadow and box_shadow != 'none'
+    has_focus_indicator = has_outline or has_border or has_shadow
+
+    focused_tag = focus_info.get('tag', '')
+    needs_indicator = focused_tag not in ['body', 'html']
+
+    return has_focus_indicator or not needs_indicator, \
+        f"Focused element ({focused_tag}) should have visible focus indicator (outline, border, or box-shadow) for keyboard users"
+
+def probe_skip_links(page, census):
+    """Complex pages offer skip to main content links."""
+    # Check for skip links (optional but good practice)
+    skip_links = census["skip_links"]
+
+    page_complexity = census["page_complexity"]
+    needs_skip_links = page_complexity > 2  # Complex pages should have skip links
+
+    # Passes if skip links exist OR page is simple enough
+    return skip_links > 0 or not needs_skip_links, \
+        f"Skip links should be considered for complex pages - found {skip_links} skip links, page has {page_complexity} landmark elements"
+
+def probe_language_attribute(page, census):
+    """The <html> element declares a language."""
+    # Check lang attribute on html element
+    lang = census["lang"]
+
+    # HTML should have lang attribute for screen readers
+    # This is a WCAG requirement
+    return lang is not None and len(lang.strip()) > 0, \
+        f"Page should have language attribute on <html> element for screen readers - found: '{lang}'"
+
+LOGIN_PAGE_PROBES = [
+    probe_keyboard_navigation,
+    probe_aria_labels,
+    probe_form_labels,
+    probe_color_contrast,
+    probe_screen_reader_compatibility,
+    probe_focus_indication,
+    probe_skip_links,
+    probe_language_attribute,
+]
+
+
+@pytest.fixture(scope="class")
+def accessibility_context(browser_context_factory):
+    """Unauthenticated browser context shared by the tests of a class."""
+    context = browser_context_factory()
+    context.add_init_script(_FOCUS_INFO_INIT_SCRIPT)
+    try:
+        yield context
+    finally:
         try:
-            buttons = page.locator("button, [role='button']").count()
-        except:
+            context.close()
+        except Exception:
             pass
-        
+
+
+@pytest.fixture(scope="function")
+def page(accessibility_context):
+    """Page in the class-wide unauthenticated context."""
+    page_obj = accessibility_context.new_page()
+    try:
+        yield page_obj
+    finally:
         try:
-            labels = page.locator("label").count()
-        except:
+            page_obj.close()
+        except Exception:
             pass
-        
-        has_semantic_structure = (headings > 0 or landmarks > 0 or aria_landmarks > 0)
-        has_form_structure = forms > 0
-        has_interactive_elements = (inputs > 0 or buttons > 0)
-        has_navigable_content = has_semantic_structure or has_form_structure or has_interactive_elements
-        
-        # Additional check: page should have some structure (not just empty)
-        page_has_structure = (headings + landmarks + aria_landmarks + forms + inputs + buttons) > 0
-        
-        assert has_navigable_content and page_has_structure, \
-            f"Page should have semantic structure or interactive elements for screen readers - " \
-            f"headings: {headings}, landmarks: {landmarks}, aria: {aria_landmarks}, " \
-            f"forms: {forms}, inputs: {inputs}, buttons: {buttons}, labels: {labels}"
-    
-    def test_focus_indication(self, page):
-        """Test focus indication for keyboard users."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
-        # Tab to input
-        page.keyboard.press("Tab")
-        page.wait_for_timeout(500)
-        
-        # Check if focused element exists and is focusable
-        focused_element = page.evaluate("() => document.activeElement")
-        assert focused_element is not None, "Focus should be visible - no element is focused"
-
-        focus_style = page.evaluate("""
+
+
+@pytest.fixture(scope="class")
+def loaded_login_page(accessibility_context):
+    """Login page opened once and shared by the read-only probes of a test class."""
+    page = accessibility_context.new_page()
+    # open() navigates with wait_until="domcontentloaded" and waits for the email field
+    LoginPage(page).open()
+    return page
+
+
+@pytest.fixture(scope="class")
+def page_element_census(loaded_login_page):
+    """Element counts and attributes of the shared login page, read once per class."""
+    try:
+        return loaded_login_page.evaluate(_ELEMENT_CENSUS_JS)
+    except Exception:
+        # The page navigated or closed mid-read; let the probes see an empty page
+        return dict(_EMPTY_CENSUS)
+
+
+@pytest.mark.xdist_group("accessibility")
+class TestAccessibility:
+    """Accessibility test suite."""
+
+    @pytest.mark.parametrize(
+        "probe",
+        LOGIN_PAGE_PROBES,
+        # Keep the original test names as ids so test case mapping still resolves
+        ids=[probe.__name__.replace("probe_", "test_", 1) for probe in LOGIN_PAGE_PROBES],
+    )
+    def test_login_page_accessibility(self, loaded_login_page, page_element_census, probe):
+        """Run a read-only accessibility probe against the shared login page."""
+        passed, message = probe(loaded_login_page, page_element_census)
+        assert passed, message
+
+    def test_alt_text_for_images(self, admin_page):
+        """Test alt text for images."""
+        page = admin_page
+
+        # Images are attached by the time the load event fires
+        page.wait_for_load_state("load", timeout=10000)
+
+        # Check the first 10 images for an alt attribute in a single browser-side scan
+        result = page.evaluate("""
             () => {
-                const el = document.activeElement;
-                if (!el) return null;
-                const style = window.getComputedStyle(el);
-                return {
-                    outline: style.outline,
-                    outlineWidth: style.outlineWidth,
-                    outlineStyle: style.outlineStyle,
-                    border: style.border,
-                    boxShadow: style.boxShadow
-                };
+                const images = [...document.querySelectorAll('img')].slice(0, 10);
+                // Alt attribute should exist (can be empty for decorative images)
+                return {checked: images.length, withAlt: images.filter(img => img.getAttribute('alt') !== null).length};
             }
         """)
-        
-        # Focus should have some visible indicator (outline, border, or box-shadow)
-        has_focus_indicator = False
-        if focus_style:
-            outline_width = focus_style.get('outlineWidth', '0px')
-            has_outline = outline_width and outline_width != '0px'
-            border = focus_style.get('border', '')
-            has_border = border and '0px' not in border
-            box_shadow = focus_style.get('boxShadow', 'none')
-            has_shadow = box_shadow and box_shadow != 'none'
-            has_focus_indicator = has_outline or has_border or has_shadow
-        
-  
-        focused_tag = page.evaluate("() => document.activeElement?.tagName?.toLowerCase() || ''")
-        needs_indicator = focused_tag not in ['body', 'html']
-        
-        assert has_focus_indicator or not needs_indicator, \
-            f"Focused element ({focused_tag}) should have visible focus indicator (outline, border, or box-shadow) for keyboard users"
-    
-    def test_alt_text_for_images(self, page):
-        """Test alt text for images."""
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(2000)
-        
-        images = page.locator("img").all()
-        images_with_alt = 0
-        images_checked = 0
-        
-        for img in images[:10]:  # Check first 10 images
-            try:
-                # Check if alt attribute exists (even if empty, it should exist)
-                alt = img.get_attribute("alt")
-                images_checked += 1
-                # Alt attribute should exist (can be empty for decorative images)
-                if alt is not None:  # Attribute exists (even if empty string)
-                    images_with_alt += 1
-            except:
-                pass
+        images_checked = result["checked"]
+        images_with_alt = result["withAlt"]
 
         assert images_with_alt == images_checked or images_checked == 0, \
             f"Images should have alt attributes - checked {images_checked} images, {images_with_alt} have alt attribute"
-    
-    def test_skip_links(self, page):
-        """Test skip to main content links."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
-        # Check for skip links (optional but good practice)
-        skip_links = page.locator('a[href*="#main"], a[href*="#content"], a[href*="#skip"]').count()
-        
-        page_complexity = page.locator("nav, header, footer, aside").count()
-        needs_skip_links = page_complexity > 2  # Complex pages should have skip links
-        
-        # Test passes if skip links exist OR page is simple enough
-        assert skip_links > 0 or not needs_skip_links, \
-            f"Skip links should be considered for complex pages - found {skip_links} skip links, page has {page_complexity} landmark elements"
-    
-    def test_error_message_accessibility(self, page):
+
+    def test_error_message_accessibility(self, page, login_page):
         """Test error messages are accessible."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
         # Try invalid login
-        login.login("wrong@email.com", "wrongpass")
-        page.wait_for_timeout(3000)
-        
-        error_elements = page.locator('[role="alert"], .error, [aria-live], [class*="error" i], [class*="alert" i]').count()
-        error_text = page.locator("body").inner_text().lower()
-        has_error_keywords = any(keyword in error_text for keyword in ["error", "invalid", "incorrect", "wrong", "failed"])
-
-        assert error_elements > 0 or has_error_keywords or "/dashboard" not in page.url, \
-            f"Error messages should be accessible - found {error_elements} ARIA error elements, error keywords in text: {has_error_keywords}, still on login: {'/dashboard' not in page.url}"
-    
+        login_page.login("wrong@email.com", "wrongpass")
+
+        # Return as soon as an error is shown; empty live regions are always attached,
+        # so only visible matches count. A login that stays put is also acceptable
+        error_locator = page.locator(_ERROR_ELEMENTS).filter(visible=True)
+        try:
+            error_locator.first.wait_for(state="visible", timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
+
+        error_elements = error_locator.count()
+        # Scan the rendered body text in the browser so only a boolean crosses the wire;
+        # innerText skips hidden templates and scripts that textContent would include,
+        # and one case-insensitive alternation walks the text once for all keywords
+        has_error_keywords = page.evaluate(
+            "(pattern) => new RegExp(pattern, 'i').test(document.body?.innerText || '')",
+            _ERROR_KEYWORDS_PATTERN,
+        )
+
+        still_on_login = "/dashboard" not in page.url
+
+        assert error_elements > 0 or has_error_keywords or still_on_login, \
+            f"Error messages should be accessible - found {error_elements} ARIA error elements, error keywords in text: {has_error_keywords}, still on login: {still_on_login}"
+
     def test_responsive_design_accessibility(self, page):
         """Test accessibility on different screen sizes."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        
-        # Test mobile viewport
+        # Set the mobile viewport before loading, so the page renders its mobile
+        # layout rather than a resized desktop one
         page.set_viewport_size({"width": 375, "height": 667})
-        login.open()
-        
-        # Check if elements are accessible on mobile
-        inputs = page.locator("input").count()
-        assert inputs > 0, "Form should be accessible on mobile"
-    
-    def test_language_attribute(self, page):
-        """Test language attribute on HTML."""
-        ensure_fresh_session(page)
-        login = LoginPage(page)
-        login.open()
-        
-        page.wait_for_load_state("domcontentloaded", timeout=10000)
-        page.wait_for_timeout(1000)
-        
-        # Check lang attribute on html element
-        lang = page.locator("html").get_attribute("lang")
-        
-        # HTML should have lang attribute for screen readers
-        # This is a WCAG requirement
-        assert lang is not None and len(lang.strip()) > 0, \
-            f"Page should have language attribute on <html> element for screen readers - found: '{lang}'"
+        LoginPage(page).open()
 
+        # Check if elements are accessible on mobile; expect polls until the layout settles
+        expect(page.locator("input").first, "Form should be accessible on mobile").to_be_visible(timeout=10000)
@@ -1,426 +1,203 @@
 """Comprehensive tests for Branch management section."""
 import pytest
-from pages.login_page import LoginPage
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, expect
 from pages.branch_page import BranchPage
-from pages.navigation_page import NavigationPage
-from config.config import ADMIN_USERNAME, ADMIN_PASSWORD
-from utils.test_helpers import ensure_fresh_session, login_user
+from utils.test_helpers import wait_for_branches_ready
+from config.config import BRANCH_URL, BRANCHES_URL
+
+# The module-scoped branch list and the serial branch form tests stay on one xdist worker
+pytestmark = pytest.mark.xdist_group("branch")
 
 def check_branch_page_exists(page):
     """Helper to check if branch page exists (not 404)."""
+    return not BranchPage(page).is_not_found()
+
+def wait_for_network_settled(page, timeout: int = 5000):
+    """Wait for in-flight requests to finish; background polling may keep the network busy, which is fine."""
     try:
-        page_text = page.locator("body").inner_text().lower()
-        return not ("page not found" in page_text or "404" in page_text or "not found" in page_text)
-    except:
-        return True  # If we can't check, assume it exists
+        page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
 
-class TestBranch:
-    """Comprehensive Branch management test suite."""
-    
-    def test_branch_page_loads(self, page):
-        """Test that branch page loads correctly."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
-        branch = BranchPage(page)
-        nav = NavigationPage(page)
-        
-        try:
-            nav.navigate_to_branches()
-        except:
-            branch.navigate_to_branches()
-        
-        page.wait_for_timeout(3000)
-        
-        # Check if branch page exists (not 404)
-        if not check_branch_page_exists(page):
+@pytest.fixture(scope="function")
+def page(admin_page):
+    """Branch tests run in a context restored from the saved admin session."""
+    return admin_page
+
+@pytest.fixture(scope="module", autouse=True)
+def branch_page(admin_context):
+    """Branch list opened once and shared by the read-only tests.
+
+    Autouse so the 404 probe runs once per module: when the branch page is
+    missing every test is skipped before any per-test page is set up.
+    """
+    branch = BranchPage(admin_context.new_page())
+    try:
+        response = branch.open()
+        if (response is not None and response.status == 404) or not check_branch_page_exists(branch.page):
             pytest.skip("Branch page is not available in this application")
-        
-        assert branch.is_loaded() or "/branch" in page.url or "/branches" in page.url, \
-            "Branch page should load"
-    
-    def test_branch_page_elements_present(self, page):
-        """Test that branch page has all expected elements."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
+        yield branch
+    finally:
         try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-        except:
-            pass
-        
-        # Check if branch page exists
-        if not check_branch_page_exists(page):
-            pytest.skip("Branch page is not available in this application")
-        
-        if branch.is_loaded() or "/branch" in page.url or "/branches" in page.url:
-            # Actually check if header is visible, don't use assert True
-            header_visible = branch.is_element_visible(branch.header, timeout=5000)
-            assert header_visible, "Branch header should be visible"
-    
-    def test_branch_search_functionality(self, page):
-        """Test search functionality on branch page."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                # Verify search input exists and can be used
-                search_input_visible = branch.is_element_visible(branch.search_input, timeout=3000)
-                if search_input_visible:
-                    initial_count = branch.get_branches_count()
-                    branch.search_branch("test")
-                    page.wait_for_timeout(2000)
-                    # Search should work (count might change or stay same)
-                    assert True, "Search functionality executed"
-                else:
-                    pytest.skip("Search input not available on branch page")
-        except:
+            branch.page.close()
+        except Exception:
             pass
+
+@pytest.fixture(scope="function")
+def branch(page):
+    """Branch list opened on a fresh admin page, for tests that open forms or leave the list."""
+    branch_obj = BranchPage(page)
+    branch_obj.open()
+    return branch_obj
+
+class TestBranch:
+    """Read-only Branch list checks sharing one navigated page."""
     
-    def test_branch_filter_by_location(self, page):
-        """Test filtering branches by location."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                # Check if filter exists
-                filter_visible = branch.is_element_visible(branch.location_filter, timeout=3000)
-                if filter_visible:
-                    branch.filter_by_location("New York")
-                    page.wait_for_timeout(2000)
-                    assert True, "Location filter executed"
-                else:
-                    pytest.skip("Location filter not available on branch page")
-        except:
-            pass
+    def test_branch_page_loads(self, branch_page):
+        """Test that branch page loads correctly."""
+        page = branch_page.page
+        assert branch_page.is_loaded() or "/branch" in page.url or "/branches" in page.url, \
+            "Branch page should load"
     
-    def test_branch_filter_by_status(self, page):
-        """Test filtering branches by status."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
+    @pytest.mark.parametrize("attr,required", [
+        pytest.param("header", True, id="test_branch_page_elements_present"),
+        pytest.param("create_branch_button", True, id="test_create_branch_button_visible"),
+        pytest.param("branches_table", True, id="test_branch_table_structure"),
+        pytest.param("search_input", False, id="test_branch_search_input_visible"),
+        pytest.param("location_filter", False, id="test_branch_location_filter_visible"),
+        pytest.param("status_filter", False, id="test_branch_status_filter_visible"),
+    ])
+    def test_branch_element_visible(self, branch_page, attr, required):
+        """Test that an element of the branch page is visible; optional filters are skipped when absent."""
+        # Required elements get time to render; optional ones are already there or absent
+        visible = branch_page.is_element_visible(getattr(branch_page, attr), timeout=3000, wait=required)
+        if required:
+            assert visible, f"Branch {attr} should be visible"
+        elif not visible:
+            pytest.skip(f"Branch {attr} not available on branch page")
+    
+    @pytest.mark.parametrize("attr,action,value", [
+        pytest.param("search_input", "search_branch", "test", id="test_branch_search_functionality"),
+        pytest.param("location_filter", "filter_by_location", "New York", id="test_branch_filter_by_location"),
+        pytest.param("status_filter", "filter_by_status", "active", id="test_branch_filter_by_status"),
+    ])
+    def test_branch_filters_narrow_results(self, branch_page, attr, action, value):
+        """Test that searching or filtering branches keeps the list rendered and never widens it."""
+        if not branch_page.is_element_visible(getattr(branch_page, attr), wait=False):
+            pytest.skip(f"Branch {attr} not available on branch page")
+        
+        initial_count = branch_page.get_branches_count()
         try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                # Check if filter exists
-                filter_visible = branch.is_element_visible(branch.status_filter, timeout=3000)
-                if filter_visible:
-                    branch.filter_by_status("active")
-                    page.wait_for_timeout(2000)
-                    assert True, "Status filter executed"
-                else:
-                    pytest.skip("Status filter not available on branch page")
-        except:
-            pass
-    
-    def test_create_branch_button_visible(self, page):
-        """Test that create branch button is visible."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
+            getattr(branch_page, action)(value)
+        except PlaywrightTimeoutError:
+            pytest.skip(f"Branch {attr} has no '{value}' option")
         try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                create_visible = branch.is_element_visible(branch.create_branch_button, timeout=3000)
-                assert create_visible, "Create branch button should be visible"
-        except:
-            pass
-    
-    def test_create_branch_form_elements(self, page):
-        """Test create branch form elements."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
+            wait_for_network_settled(branch_page.page)
+            assert check_branch_page_exists(branch_page.page), f"Branch list should still render after {action}"
+            assert branch_page.get_branches_count() <= initial_count, f"{action} should not add branches to the list"
+        finally:
+            # Reopen the list so no search or filter carries over to the following tests
+            branch_page.open()
+            wait_for_branches_ready(branch_page.page, branch_page)
+    
+    def test_branch_pagination(self, branch_page):
+        """Test pagination on branch page."""
+        if not branch_page.is_element_visible(branch_page.next_page_button, wait=False):
+            pytest.skip("Pagination not available on branch page")
         
         try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                branch.click_create_branch()
-                page.wait_for_timeout(2000)
-                
-                form_visible = branch.is_element_visible(branch.branch_form, timeout=3000)
-                assert form_visible, "Branch form should be visible after clicking create"
-        except:
-            pass
-    
-    def test_fill_branch_form(self, page):
-        """Test filling branch creation form."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
+            branch_page.click_element(branch_page.next_page_button)
+            wait_for_network_settled(branch_page.page)
+            assert branch_page.is_element_visible(branch_page.branches_table, timeout=5000), \
+                "Branch table should still be shown after moving to the next page"
+        finally:
+            # Reopen the list so the following tests start from the first page
+            branch_page.open()
+            wait_for_branches_ready(branch_page.page, branch_page)
+    
+    def test_branch_page_refresh(self, branch_page):
+        """Test that branch page works after refresh."""
+        page = branch_page.page
+        page.reload(wait_until="domcontentloaded")
+        wait_for_branches_ready(page, branch_page)
         
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                branch.click_create_branch()
-                page.wait_for_timeout(2000)
-                
-                # Fill form with test data
-                branch.fill_branch_form(
-                    name="Test Branch",
-                    code="TB001",
-                    address="123 Test Street",
-                    city="Test City",
-                    state="Test State",
-                    zipcode="12345",
-                    phone="123-456-7890",
-                    email="testbranch@example.com",
-                    status="active"
-                )
-                page.wait_for_timeout(1000)
-                # Verify form was filled (check if inputs have values)
-                assert True, "Branch form fill executed"
-        except:
-            pass
-    
-    def test_view_branch_functionality(self, page):
+        # The module already confirmed the page exists, so a 404 after refresh is a failure
+        assert branch_page.is_loaded(), "Branch page should load after refresh"
+
+class TestBranchActions:
+    """Branch tests that open forms or leave the list page, each on a fresh admin page."""
+    
+    def test_branch_form_journey(self, page, branch):
+        """Test the create branch form: open, validation, fill, cancel and reopen."""
+        # Scoped to the create form: the list page may already carry search or filter forms
+        form = page.locator("form").filter(has=branch.branch_name_input_locator).or_(
+            page.locator('[data-testid*="branch-form"]')
+        ).first
+        name_input = form.locator(branch.branch_name_input).first
+        
+        branch.click_create_branch()
+        expect(form, "Branch form should be visible after clicking create").to_be_visible(timeout=5000)
+        
+        # Try to save without filling required fields; validation should keep the form open
+        branch.save_branch_form()
+        expect(form, "Empty branch form should not be submitted").to_be_visible()
+        
+        # Fill form with test data
+        branch.fill_branch_form(
+            name="Test Branch",
+            code="TB001",
+            address="123 Test Street",
+            city="Test City",
+            state="Test State",
+            zipcode="12345",
+            phone="123-456-7890",
+            email="testbranch@example.com",
+            status="active"
+        )
+        expect(name_input).to_have_value("Test Branch")
+        
+        branch.cancel_branch_form()
+        expect(form, "Branch form should close after cancel").to_be_hidden(timeout=3000)
+        
+        # Reopening gives a usable form again; it is not saved so no branch is created on the portal
+        branch.click_create_branch()
+        expect(form, "Branch form should reopen after cancel").to_be_visible(timeout=5000)
+        branch.fill_branch_form(name="Test Branch")
+        expect(name_input).to_have_value("Test Branch")
+    
+    def test_view_branch_functionality(self, page, branch):
         """Test viewing a branch."""
-        ensure_fresh_session(page)
+        if branch.get_branches_count() == 0:
+            pytest.skip("No branches to view")
         
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded() and branch.get_branches_count() > 0:
-                branch.view_branch(0)
-                page.wait_for_timeout(2000)
-                # Verify view action completed (page might change or modal might open)
-                assert True, "View branch action executed"
-        except:
-            pass
+        branch.view_branch(0)
+        # The view may open a details page or a modal; either way it must not be a 404
+        assert check_branch_page_exists(page), "Viewing a branch should not lead to a missing page"
     
-    def test_edit_branch_functionality(self, page):
+    def test_edit_branch_functionality(self, page, branch):
         """Test editing a branch."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded() and branch.get_branches_count() > 0:
-                branch.edit_branch(0)
-                page.wait_for_timeout(2000)
-                
-                if branch.is_element_visible(branch.branch_form, timeout=3000):
-                    branch.fill_branch_form(name="Updated Branch Name")
-                    branch.save_branch_form()
-                    page.wait_for_timeout(2000)
-                    assert True, "Edit branch action executed"
-        except:
-            pass
-    
-    def test_branch_table_structure(self, page):
-        """Test branch table structure."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                table_visible = branch.is_element_visible(branch.branches_table, timeout=3000)
-                assert table_visible, "Branch table should be visible"
-        except:
-            pass
-    
-    def test_branch_pagination(self, page):
-        """Test pagination on branch page."""
-        ensure_fresh_session(page)
+        if branch.get_branches_count() == 0:
+            pytest.skip("No branches to edit")
         
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                if branch.is_element_visible(branch.next_page_button, timeout=2000):
-                    branch.click_element(branch.next_page_button)
-                    page.wait_for_timeout(2000)
-                    assert True, "Pagination action executed"
-                else:
-                    pytest.skip("Pagination not available on branch page")
-        except:
-            pass
-    
-    def test_branch_page_refresh(self, page):
-        """Test that branch page works after refresh."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
+        branch.edit_branch(0)
+        if not branch.is_element_visible(branch.branch_form, timeout=3000):
+            pytest.skip("Edit form not available for branches")
         
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                page.reload(wait_until="networkidle")
-                page.wait_for_timeout(2000)
-                
-                # Check again after refresh
-                if not check_branch_page_exists(page):
-                    pytest.skip("Branch page is not available after refresh")
-                
-                assert branch.is_loaded() or "/branch" in page.url or "/branches" in page.url, \
-                    "Branch page should load after refresh"
-        except:
-            pass
+        branch.fill_branch_form(name="Updated Branch Name")
+        branch.save_branch_form()
+        wait_for_network_settled(page)
+        assert check_branch_page_exists(page), "Saving an edited branch should not lead to a missing page"
     
-    def test_branch_direct_url_access(self, page):
+    @pytest.mark.parametrize("path,url", [("/branch", BRANCH_URL), ("/branches", BRANCHES_URL)], ids=["/branch", "/branches"])
+    def test_branch_direct_url_access(self, page, path, url):
         """Test direct URL access to branch page when logged in."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
-        base_url = page.url.split('/dashboard')[0]
-        # Try both /branch and /branches
-        page.goto(f"{base_url}/branches", wait_until="networkidle")
-        page.wait_for_timeout(3000)
+        page.goto(url, wait_until="domcontentloaded")
+        branch = BranchPage(page)
+        wait_for_branches_ready(page, branch)
         
         # Check if branch page exists
         if not check_branch_page_exists(page):
-            pytest.skip("Branch page is not available in this application")
+            pytest.skip(f"Branch page is not available at {path}")
         
-        branch = BranchPage(page)
-        assert branch.is_loaded() or "/branch" in page.url or "/branches" in page.url, \
-            "Should be able to access branch page directly when logged in"
-    
-    def test_cancel_branch_form(self, page):
-        """Test canceling branch form."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                branch.click_create_branch()
-                page.wait_for_timeout(2000)
-                
-                if branch.is_element_visible(branch.branch_form, timeout=3000):
-                    branch.cancel_branch_form()
-                    page.wait_for_timeout(1000)
-                    # Verify cancel worked (form should close or disappear)
-                    assert True, "Cancel branch form action executed"
-        except:
-            pass
-    
-    def test_branch_form_validation(self, page):
-        """Test branch form validation."""
-        ensure_fresh_session(page)
-        
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        
-        try:
-            branch.navigate_to_branches()
-            page.wait_for_timeout(3000)
-            
-            # Check if branch page exists
-            if not check_branch_page_exists(page):
-                pytest.skip("Branch page is not available in this application")
-            
-            if branch.is_loaded():
-                branch.click_create_branch()
-                page.wait_for_timeout(2000)
-                
-                if branch.is_element_visible(branch.branch_form, timeout=3000):
-                    # Try to save without filling required fields
-                    branch.save_branch_form()
-                    page.wait_for_timeout(2000)
-                    # Form should show validation errors or prevent submission
-                    assert True, "Branch form validation check executed"
-        except:
-            pass
+        assert path in page.url and branch.is_loaded(), \
+            f"Should be able to access branch page directly at {path} when logged in"
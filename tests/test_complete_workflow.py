@@ -1,6 +1,7 @@
 """Complete end-to-end workflow tests covering all sections."""
 import pytest
 import allure
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, expect
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.reports_page import ReportsPage
@@ -10,139 +11,111 @@ from pages.tasks_page import TasksPage
 from pages.settings_page import SettingsPage
 from pages.navigation_page import NavigationPage
 from config.config import ADMIN_USERNAME, ADMIN_PASSWORD, USER_USERNAME, USER_PASSWORD
-from utils.test_helpers import ensure_fresh_session, login_user
+from utils.test_helpers import wait_for_branches_ready
+
+# Main sections, one navigation test each so they can be scheduled and reported separately
+SECTIONS = [
+    ("dashboard", DashboardPage),
+    ("tasks", TasksPage),
+    ("reports", ReportsPage),
+    ("users", UsersPage),
+    ("branches", BranchPage),
+    ("settings", SettingsPage),
+]
 
 class TestCompleteWorkflow:
     """Complete workflow tests covering all sections."""
     
-    def test_full_application_navigation(self, page):
-        """Test navigating through all sections of the application."""
-        allure.dynamic.title("Workflow: Navigate main application sections")
-        allure.dynamic.description("Navigate to main application sections (dashboard, tasks, reports, users, branches, settings) and verify pages load or at least some are accessible.")
-
-        ensure_fresh_session(page)
-
-        # Login
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        assert dashboard.is_loaded(), "Dashboard should load after login"
-
-        nav = NavigationPage(page)
-
-        # Navigate through all sections and record successes
-        sections = [
-            ("dashboard", DashboardPage),
-            ("tasks", TasksPage),
-            ("reports", ReportsPage),
-            ("users", UsersPage),
-            ("branches", BranchPage),
-            ("settings", SettingsPage),
-        ]
-
-        accessible = []
-        for section_name, page_class in sections:
-            try:
-                # Call navigation helper dynamically
-                getattr(nav, f"navigate_to_{section_name}")()
-                page.wait_for_timeout(1000)
-                section_page = page_class(page)
-                if section_page.is_loaded(timeout=5000):
-                    accessible.append(section_name)
-            except Exception:
-                # Skip sections that fail to load in this environment
-                continue
-
-        assert len(accessible) > 0, "At least one major section should be accessible"
+    @pytest.mark.parametrize("section_name,page_class", SECTIONS, ids=[name for name, _ in SECTIONS])
+    def test_full_application_navigation(self, admin_page, section_name, page_class):
+        """Test navigating to each main section of the application."""
+        allure.dynamic.title(f"Workflow: Navigate to {section_name}")
+        allure.dynamic.description(f"Navigate from the dashboard to the {section_name} section and verify the page loads.")
+
+        # Call navigation helper dynamically
+        getattr(NavigationPage(admin_page), f"navigate_to_{section_name}")()
+        if page_class is BranchPage and BranchPage(admin_page).is_not_found():
+            pytest.skip("Branch page is not available in this application")
+        assert page_class(admin_page).is_loaded(timeout=5000), f"{section_name.capitalize()} section should load"
     
-    def test_complete_user_management_workflow(self, page):
+    def test_complete_user_management_workflow(self, admin_page):
         """Test complete user management workflow."""
         allure.dynamic.title("Workflow: User management end-to-end")
         allure.dynamic.description("Navigate to Users, perform search/filter, and open a user details view when available.")
 
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        users = UsersPage(page)
-        nav = NavigationPage(page)
+        users = UsersPage(admin_page)
+        nav = NavigationPage(admin_page)
 
         nav.navigate_to_users()
         assert users.is_loaded(), "Users page should be loaded"
 
         users_count = users.get_users_count()
         users.search_user("test")
-        page.wait_for_timeout(500)
         users.filter_by_role("admin")
-        page.wait_for_timeout(500)
 
         if users_count > 0:
             users.view_user(0)
-            page.wait_for_timeout(500)
-            # Expect a detail label such as Email
-            assert page.get_by_text("Email", exact=False).count() > 0 or users.is_element_visible(users.user_form, timeout=2000), "User details should be visible"
+            # Expect a detail label such as Email, or the user form; whichever shows first
+            user_detail = admin_page.get_by_text("Email", exact=False).or_(users.user_form_locator).first
+            expect(user_detail, "User details should be visible").to_be_visible(timeout=2000)
         else:
             assert users.is_loaded(), "Users page remains loaded"
     
-    def test_complete_branch_management_workflow(self, page):
+    def test_complete_branch_management_workflow(self, admin_page):
         """Test complete branch management workflow."""
         allure.dynamic.title("Workflow: Branch management end-to-end")
         allure.dynamic.description("Navigate to Branches, perform search/filter and view a branch when available.")
 
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        branch = BranchPage(page)
-        nav = NavigationPage(page)
+        branch = BranchPage(admin_page)
+        nav = NavigationPage(admin_page)
 
         nav.navigate_to_branches()
+        wait_for_branches_ready(admin_page, branch)
         assert branch.is_loaded(), "Branches page should be loaded"
 
         branches_count = branch.get_branches_count()
         branch.search_branch("test")
-        page.wait_for_timeout(500)
+        wait_for_branches_ready(admin_page, branch)
         branch.filter_by_status("active")
-        page.wait_for_timeout(500)
+        wait_for_branches_ready(admin_page, branch)
 
         if branches_count > 0:
             branch.view_branch(0)
-            page.wait_for_timeout(500)
-            # Basic verification: branch detail visible (best-effort)
-            body_text = page.locator('body').inner_text().lower()
-            assert branch.is_loaded() or ("error" not in body_text and "exception" not in body_text), "Viewing branch should not crash the UI"
+            # Basic verification: branch detail visible (best-effort); error text is only counted
+            # when the page did not load, and only the match count crosses the wire
+            error_text = admin_page.locator("text=/error|exception/i")
+            assert branch.is_loaded() or error_text.count() == 0, "Viewing branch should not crash the UI"
         else:
             assert branch.is_loaded(), "Branches page remains accessible"
     
-    def test_complete_reports_workflow(self, page):
+    def test_complete_reports_workflow(self, admin_page):
         """Test complete reports workflow."""
         allure.dynamic.title("Workflow: Reports end-to-end")
         allure.dynamic.description("Navigate to Reports, apply search and date filters, and view a report if present.")
 
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        reports = ReportsPage(page)
-        nav = NavigationPage(page)
+        reports = ReportsPage(admin_page)
+        nav = NavigationPage(admin_page)
 
         nav.navigate_to_reports()
         assert reports.is_loaded(), "Reports page should be loaded"
 
         reports_count = reports.get_reports_count()
         reports.search_report("test")
-        page.wait_for_timeout(500)
         reports.filter_by_date("2024-01-01", "2024-12-31")
-        page.wait_for_timeout(500)
 
         if reports_count > 0:
             reports.view_report(0)
-            page.wait_for_timeout(500)
             assert reports.is_element_visible(reports.report_detail_view, timeout=3000), "Report detail should be visible"
         else:
             assert reports.is_loaded(), "Reports page remains accessible"
     
-    def test_complete_settings_workflow(self, page):
+    def test_complete_settings_workflow(self, admin_page):
         """Test complete settings workflow."""
         allure.dynamic.title("Workflow: Settings end-to-end")
         allure.dynamic.description("Navigate settings tabs and perform a profile update action, ensuring no errors.")
 
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        settings = SettingsPage(page)
-        nav = NavigationPage(page)
+        settings = SettingsPage(admin_page)
+        nav = NavigationPage(admin_page)
 
         nav.navigate_to_settings()
         assert settings.is_loaded(), "Settings page should be loaded"
@@ -150,29 +123,24 @@ class TestCompleteWorkflow:
         tabs = ["general", "profile", "security", "notifications"]
         for tab in tabs:
             settings.switch_to_tab(tab)
-            page.wait_for_timeout(300)
 
         settings.switch_to_tab("profile")
         settings.update_profile(name="Test User")
-        page.wait_for_timeout(500)
 
         # Basic verification: settings page still accessible
         assert settings.is_loaded(), "Settings update completed and page accessible"
     
-    def test_multi_section_workflow(self, page):
+    def test_multi_section_workflow(self, admin_page):
         """Test workflow across multiple sections."""
         allure.dynamic.title("Workflow: Multi-section navigation")
         allure.dynamic.description("Quickly navigate through multiple sections in sequence and ensure navigation commands succeed for at least one section.")
 
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        nav = NavigationPage(page)
+        nav = NavigationPage(admin_page)
 
         sections_navigated = 0
         for fn in ["navigate_to_dashboard", "navigate_to_tasks", "navigate_to_reports", "navigate_to_users", "navigate_to_branches", "navigate_to_settings"]:
             try:
                 getattr(nav, fn)()
-                page.wait_for_timeout(500)
                 sections_navigated += 1
             except Exception:
                 continue
@@ -191,13 +159,16 @@ class TestCompleteWorkflow:
         allure.dynamic.title(f"Access: Full app access check for {username}")
         allure.dynamic.description("Login as different user roles and verify the user can access at least one major section.")
 
-        ensure_fresh_session(page)
-
+        # The page fixture already runs in a brand-new browser context
         login = LoginPage(page)
         login.open()
         login.login(username, password)
 
-        page.wait_for_timeout(3000)
+        try:
+            page.wait_for_url("**/dashboard**", timeout=15000)
+        except PlaywrightTimeoutError:
+            # Users without portal access stay off the dashboard
+            pass
 
         sections_accessed = []
         if "/dashboard" in page.url:
@@ -205,7 +176,6 @@ class TestCompleteWorkflow:
             for fn, name in [("navigate_to_dashboard", "dashboard"), ("navigate_to_tasks", "tasks"), ("navigate_to_reports", "reports"), ("navigate_to_users", "users"), ("navigate_to_branches", "branches"), ("navigate_to_settings", "settings")]:
                 try:
                     getattr(nav, fn)()
-                    page.wait_for_timeout(500)
                     sections_accessed.append(name)
                 except Exception:
                     continue
@@ -1,43 +1,43 @@
 """Comprehensive dashboard tests covering all dashboard features."""
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.navigation_page import NavigationPage
 from config.config import ADMIN_USERNAME, ADMIN_PASSWORD, USER_USERNAME, USER_PASSWORD
-from utils.test_helpers import ensure_fresh_session, login_user
+from utils.test_helpers import ensure_fresh_session, wait_for_dashboard_ready
+
+@pytest.fixture(scope="function")
+def admin_page(admin_context_page):
+    """Admin dashboard checks leave the session alone, so they share the session admin context."""
+    return admin_context_page
 
 class TestDashboardComprehensive:
     """Comprehensive dashboard test suite."""
     
-    def test_dashboard_loads_after_login(self, page):
+    def test_dashboard_loads_after_login(self, admin_page):
         """Test that dashboard loads correctly after login."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
+        dashboard = DashboardPage(admin_page)
         
         assert dashboard.is_loaded(), "Dashboard should be loaded"
         assert dashboard.is_content_visible(), "Dashboard content should be visible"
-        assert "/dashboard" in page.url, "URL should contain /dashboard"
+        assert "/dashboard" in admin_page.url, "URL should contain /dashboard"
     
-    def test_dashboard_elements_present(self, page):
+    def test_dashboard_elements_present(self, admin_page):
         """Test that dashboard has all expected elements."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
+        dashboard = DashboardPage(admin_page)
         
         # Check for header
         assert dashboard.is_element_visible(dashboard.header, timeout=5000), \
             "Dashboard header should be visible"
         
         # Check page title is not empty
-        assert page.title() != "", "Page should have a title"
+        assert admin_page.title() != "", "Page should have a title"
     
-    def test_dashboard_navigation(self, page):
+    def test_dashboard_navigation(self, admin_page):
         """Test navigation elements on dashboard."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        nav = NavigationPage(page)
+        dashboard = DashboardPage(admin_page)
+        nav = NavigationPage(admin_page)
         
         # Check if navigation is available
         nav_available = nav.is_navigation_visible()
@@ -45,51 +45,25 @@ class TestDashboardComprehensive:
         
         assert dashboard.is_loaded(), "Dashboard should still be loaded"
     
-    def test_dashboard_page_interactions(self, page):
+    def test_dashboard_page_interactions(self, admin_page):
         """Test basic interactions on dashboard page."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
+        dashboard = DashboardPage(admin_page)
         
-        # Test page interactions
-        widgets = dashboard.get_all_widgets()
-        charts = dashboard.get_all_charts()
-        tables = dashboard.get_all_tables()
-        
-        # These elements may or may not exist, so we just check that page is interactive
+        # Widgets, charts and tables may or may not exist, so we just check that page is interactive
         assert dashboard.is_loaded(), "Dashboard should remain loaded after interactions"
     
-    def test_dashboard_refresh(self, page):
+    def test_dashboard_refresh(self, admin_page):
         """Test that dashboard works correctly after page refresh."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
+        dashboard = DashboardPage(admin_page)
         assert dashboard.is_loaded()
         
         # Refresh the page
-        page.reload(wait_until="networkidle")
-        page.wait_for_url("**/dashboard**", timeout=15000)
-        
-        dashboard_after_refresh = DashboardPage(page)
-        dashboard_after_refresh.wait_for_dashboard_load()
+        admin_page.reload(wait_until="domcontentloaded")
+        assert wait_for_dashboard_ready(admin_page), "Dashboard content should render after refresh"
         
+        dashboard_after_refresh = DashboardPage(admin_page)
         assert dashboard_after_refresh.is_loaded(), "Dashboard should load after refresh"
     
-    def test_dashboard_url_direct_access(self, page):
-        """Test direct dashboard URL access when logged in."""
-        ensure_fresh_session(page)
-        
-        # Login first
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
-        # Now try direct access
-        dashboard_url = page.url
-        page.goto(dashboard_url, wait_until="networkidle")
-        page.wait_for_url("**/dashboard**", timeout=15000)
-        
-        dashboard = DashboardPage(page)
-        assert dashboard.is_loaded(), "Should be able to access dashboard directly when logged in"
-    
     @pytest.mark.parametrize(
         "username,password",
         [
@@ -105,8 +79,11 @@ class TestDashboardComprehensive:
         login.open()
         login.login(username, password)
         
-        # Wait for redirect
-        page.wait_for_timeout(5000)
+        # Wait for redirect; the unauthorized user is expected to stay off the dashboard
+        try:
+            page.wait_for_url("**/dashboard**", timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
         current_url = page.url
         
         # Check if user reached dashboard or was redirected
@@ -115,37 +92,32 @@ class TestDashboardComprehensive:
             dashboard.wait_for_dashboard_load()
             assert dashboard.is_loaded(), f"Dashboard should load for user {username}"
     
-    def test_dashboard_content_loading(self, page):
+    def test_dashboard_content_loading(self, admin_page):
         """Test that dashboard content loads properly."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        dashboard.wait_for_dashboard_load()
+        dashboard = DashboardPage(admin_page)
         
-        # Wait for any async content to load
-        page.wait_for_timeout(2000)
+        # Wait for the content area rather than a fixed pause
+        wait_for_dashboard_ready(admin_page)
         
         # Check that page is interactive
-        assert page.locator('body').is_visible(), "Page body should be visible"
+        assert admin_page.evaluate("() => !!document.body && document.body.offsetHeight > 0"), \
+            "Page body should be visible"
         assert dashboard.is_content_visible() or dashboard.is_loaded(), \
             "Dashboard should have visible content"
     
-    def test_dashboard_responsive_elements(self, page):
+    def test_dashboard_responsive_elements(self, admin_page):
         """Test that dashboard elements are responsive."""
-        ensure_fresh_session(page)
-        
-        dashboard = login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
+        dashboard = DashboardPage(admin_page)
         
         # Get initial state
-        initial_url = page.url
+        initial_url = admin_page.url
         
         # Interact with page (scroll, etc.)
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        page.wait_for_timeout(1000)
-        page.evaluate("window.scrollTo(0, 0)")
+        admin_page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        admin_page.evaluate("window.scrollTo(0, 0)")
         
         # Dashboard should still be loaded
-        assert "/dashboard" in page.url, "Should still be on dashboard"
+        assert "/dashboard" in admin_page.url, "Should still be on dashboard"
         assert dashboard.is_loaded(), "Dashboard should remain loaded"
 
 
@@ -4,52 +4,71 @@ from pages.login_page import LoginPage
 from pages.users_page import UsersPage
 from pages.branch_page import BranchPage
 from config.config import ADMIN_USERNAME, ADMIN_PASSWORD
-from utils.test_helpers import ensure_fresh_session, login_user
+from utils.test_helpers import ensure_fresh_session
+
+INVALID_EMAILS = [
+    "invalid",
+    "invalid@",
+    "@invalid.com",
+    "invalid@.com",
+    "invalid.com",
+    "invalid@com",
+    "invalid@@com.com",
+    "invalid@com@com",
+    "invalid space@email.com",
+    "invalid@email .com",
+    "invalid@email..com",
+    pytest.param("", id="empty"),
+    pytest.param(" ", id="space"),
+]
+
+SPECIAL_CHAR_EMAILS = [
+    "test!@#$%^&*()@email.com",
+    "test<script>@email.com",
+    "test&email@test.com",
+    "test'email@test.com",
+    'test"email@test.com',
+]
+
+UNICODE_EMAILS = [
+    "tëst@email.com",
+    "测试@email.com",
+    "тест@email.com",
+    "test@éxample.com",
+]
+
+# Username is case-insensitive, password is case-sensitive; ids keep credentials out of reports
+CASE_VARIATIONS = [
+    pytest.param(ADMIN_USERNAME.upper(), ADMIN_PASSWORD, True, id="username_upper"),
+    pytest.param(ADMIN_USERNAME.capitalize(), ADMIN_PASSWORD, True, id="username_capitalized"),
+    pytest.param(ADMIN_USERNAME.swapcase(), ADMIN_PASSWORD, True, id="username_swapcase"),
+    pytest.param(ADMIN_USERNAME, ADMIN_PASSWORD.upper(), False, id="password_upper"),
+    pytest.param(ADMIN_USERNAME, ADMIN_PASSWORD.capitalize(), False, id="password_capitalized"),
+]
 
 class TestDataValidation:
     """Data validation test suite."""
     
-    def test_email_format_validation(self, page):
+    @pytest.mark.parametrize("email", INVALID_EMAILS)
+    def test_email_format_validation(self, page, email):
         """Test email format validation."""
         ensure_fresh_session(page)
         login = LoginPage(page)
         login.open()
         
-        invalid_emails = [
-            "invalid",
-            "invalid@",
-            "@invalid.com",
-            "invalid@.com",
-            "invalid.com",
-            "invalid@com",
-            "invalid@@com.com",
-            "invalid@com@com",
-            "invalid space@email.com",
-            "invalid@email .com",
-            "invalid@email..com",
-            "",
-            " ",
-        ]
-        
-        for email in invalid_emails:
-            ensure_fresh_session(page)
-            login.open()
-            login.clear_email_field()
-            login.fill_input(login.email_input, email)
-            login.click_element(login.next_button)
-            page.wait_for_timeout(2000)
-            # Should not proceed to dashboard - verify we're still on login or have error
-            assert "/dashboard" not in page.url, \
-                f"Invalid email '{email[:20]}...' should not allow login"
+        login.clear_email_field()
+        login.fill_input(login.email_input, email)
+        login.click_element(login.next_button)
+        login.wait_for_login_rejected(timeout=2000)
+        # Should not proceed to dashboard - verify we're still on login or have error
+        assert "/dashboard" not in page.url, \
+            f"Invalid email '{email[:20]}...' should not allow login"
     
-    def test_password_strength_validation(self, page):
+    def test_password_strength_validation(self, admin_page):
         """Test password strength validation."""
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
         # Navigate to password change if available
         # This would test password strength requirements
-        assert "/dashboard" in page.url, "Should be logged in"
+        assert "/dashboard" in admin_page.url, "Should be logged in"
     
     def test_required_field_validation(self, page):
         """Test required field validation."""
@@ -60,13 +79,13 @@ class TestDataValidation:
         # Try to submit without filling email
         try:
             login.click_element(login.next_button)
-            page.wait_for_timeout(2000)
+            login.wait_for_login_rejected(timeout=2000)
             # Should show validation error or prevent submission
             assert "/dashboard" not in page.url, "Should not proceed without required fields"
         except Exception as e:
             # Button might be disabled or not interactable; verify disabled attribute if possible
             try:
-                btn = page.locator(login.next_button).first
+                btn = login.next_button_locator.first
                 disabled = btn.get_attribute("disabled")
                 assert disabled is not None or "/dashboard" not in page.url, f"Unexpected behavior when submitting empty form: {e}"
             except Exception:
@@ -81,65 +100,46 @@ class TestDataValidation:
         # Very long email
         long_email = "a" * 300 + "@test.com"
         login.fill_input(login.email_input, long_email)
-        page.wait_for_timeout(1000)
         
         # Field should limit input or show error; if not, skip to avoid false negatives
-        value = page.locator(login.email_input).input_value()
+        value = login.email_input_locator.input_value()
         if len(value) > 300:
             pytest.skip("Email accepted length > 300; cannot assert max-length reliably in this environment")
         assert len(value) <= 300, "Email length should be validated"
     
-    def test_special_character_handling(self, page):
+    @pytest.mark.parametrize("email", SPECIAL_CHAR_EMAILS)
+    def test_special_character_handling(self, page, email):
         """Test special character handling in inputs."""
         ensure_fresh_session(page)
         login = LoginPage(page)
         login.open()
         
-        special_chars = [
-            "test!@#$%^&*()@email.com",
-            "test<script>@email.com",
-            "test&email@test.com",
-            "test'email@test.com",
-            'test"email@test.com',
-        ]
-        
-        for email in special_chars:
-            login.clear_email_field()
-            login.fill_input(login.email_input, email)
-            page.wait_for_timeout(500)
-            # Should not allow login with special characters in password (if validation exists)
-            # Or should handle them appropriately
-            # We can't verify sanitization, but we can verify it doesn't cause an error page
-            body_text = page.locator('body').inner_text().lower()
-            assert 'error' not in body_text and 'exception' not in body_text, \
-                "Special characters caused an error or crash"
+        login.clear_email_field()
+        login.fill_input(login.email_input, email)
+        # Should not allow login with special characters in password (if validation exists)
+        # Or should handle them appropriately
+        # We can't verify sanitization, but we can verify it doesn't cause an error page
+        body_text = page.locator('body').inner_text().lower()
+        assert 'error' not in body_text and 'exception' not in body_text, \
+            "Special characters caused an error or crash"
     
-    def test_numeric_validation(self, page):
+    def test_numeric_validation(self, admin_page):
         """Test numeric field validation."""
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
         # Navigate to forms with numeric fields (phone, zipcode, etc.)
         # This would test numeric validation
-        assert "/dashboard" in page.url
+        assert "/dashboard" in admin_page.url
     
-    def test_date_validation(self, page):
+    def test_date_validation(self, admin_page):
         """Test date field validation."""
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
         # Navigate to forms with date fields
         # This would test date format validation
-        assert "/dashboard" in page.url
+        assert "/dashboard" in admin_page.url
     
-    def test_phone_number_validation(self, page):
+    def test_phone_number_validation(self, admin_page):
         """Test phone number format validation."""
-        ensure_fresh_session(page)
-        login_user(page, ADMIN_USERNAME, ADMIN_PASSWORD)
-        
         # Navigate to user/branch forms with phone fields
         # This would test phone number validation
-        assert "/dashboard" in page.url
+        assert "/dashboard" in admin_page.url
     
     def test_whitespace_trimming(self, page):
         """Test that whitespace is trimmed from username and password (both should pass after trimming)."""
@@ -159,62 +159,34 @@ class TestDataValidation:
         page.wait_for_url("**/dashboard**", timeout=15000)
         assert "/dashboard" in page.url, "Password with whitespace should pass (trimmed)"
     
-    def test_unicode_character_handling(self, page):
+    @pytest.mark.parametrize("email", UNICODE_EMAILS)
+    def test_unicode_character_handling(self, page, email):
         """Test Unicode character handling."""
         ensure_fresh_session(page)
         login = LoginPage(page)
         login.open()
         
-        unicode_emails = [
-            "tëst@email.com",
-            "测试@email.com",
-            "тест@email.com",
-            "test@éxample.com",
-        ]
-        
-        for email in unicode_emails:
-            login.clear_email_field()
-            login.fill_input(login.email_input, email)
-            page.wait_for_timeout(1000)
-            # Should handle Unicode characters without crashing
-            # We can verify the input was accepted (doesn't crash)
-            email_field = login.email_input
-            if page.locator(email_field).is_visible():
-                value = page.locator(email_field).input_value()
-                assert len(value) > 0, "Unicode characters should be accepted in input"
+        login.clear_email_field()
+        login.fill_input(login.email_input, email)
+        # Should handle Unicode characters without crashing
+        # We can verify the input was accepted (doesn't crash)
+        if login.email_input_locator.is_visible():
+            value = login.email_input_locator.input_value()
+            assert len(value) > 0, "Unicode characters should be accepted in input"
     
-    def test_case_sensitivity_validation(self, page):
+    @pytest.mark.parametrize("username,password,should_pass", CASE_VARIATIONS)
+    def test_case_sensitivity_validation(self, page, username, password, should_pass):
         """Test case sensitivity - username is case-insensitive, password is case-sensitive."""
         ensure_fresh_session(page)
         login = LoginPage(page)
         login.open()
+        login.login(username, password)
         
-        # Username case variations should all pass (username is case-insensitive)
-        username_variations = [
-            ADMIN_USERNAME.upper(),
-            ADMIN_USERNAME.capitalize(),
-            ADMIN_USERNAME.swapcase(),
-        ]
-        
-        for username in username_variations:
-            ensure_fresh_session(page)
-            login.open()
-            login.login(username, ADMIN_PASSWORD)
+        if should_pass:
             page.wait_for_url("**/dashboard**", timeout=15000)
             assert "/dashboard" in page.url, \
                 f"Username case variation should pass (case-insensitive): {username}"
-        
-        # Password case variations should fail (password is case-sensitive)
-        password_variations = [
-            ADMIN_PASSWORD.upper(),
-            ADMIN_PASSWORD.capitalize(),
-        ]
-        
-        for password in password_variations:
-            ensure_fresh_session(page)
-            login.open()
-            login.login(ADMIN_USERNAME, password)
-            page.wait_for_timeout(5000)
+        else:
+            login.wait_for_login_rejected(timeout=5000)
             assert "/dashboard" not in page.url, \
                 f"Password case variation should fail (case-sensitive)"
-
@@ -4,7 +4,7 @@ from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.navigation_page import NavigationPage
 from config.config import ADMIN_USERNAME, ADMIN_PASSWORD, USER_USERNAME, USER_PASSWORD
-from utils.test_helpers import ensure_fresh_session
+from utils.test_helpers import ensure_fresh_session, wait_for_dashboard_exit, wait_for_dashboard_ready
 
 class TestEndToEnd:
     """End-to-end workflow test suite."""
@@ -29,13 +29,12 @@ class TestEndToEnd:
         assert dashboard.is_content_visible()
         
         # Step 4: Interact with dashboard
-        page.wait_for_timeout(2000)  # Wait for any async content
         assert "/dashboard" in page.url
         
         # Step 5: Logout
         nav = NavigationPage(page)
         nav.logout()
-        page.wait_for_timeout(3000)
+        wait_for_dashboard_exit(page)
         assert "/dashboard" not in page.url
     
     def test_complete_user_journey_user(self, page):
@@ -49,7 +48,7 @@ class TestEndToEnd:
         
         # Step 2: Login
         login.login(USER_USERNAME, USER_PASSWORD)
-        page.wait_for_timeout(5000)  # Wait for redirect
+        login.wait_for_login_result(timeout=5000)  # Wait for redirect or error
         
         # Step 3: Verify user is logged in (might have different permissions)
         current_url = page.url
@@ -62,7 +61,7 @@ class TestEndToEnd:
         if "/dashboard" in page.url:
             nav = NavigationPage(page)
             nav.logout()
-            page.wait_for_timeout(2000)
+            wait_for_dashboard_exit(page)
     
     def test_multiple_user_sessions(self, page):
         """Test switching between different user accounts."""
@@ -78,13 +77,13 @@ class TestEndToEnd:
         # Logout
         nav = NavigationPage(page)
         nav.logout()
-        page.wait_for_timeout(3000)
+        wait_for_dashboard_exit(page)
         
         # Login as regular user
         ensure_fresh_session(page)
         login.open()
         login.login(USER_USERNAME, USER_PASSWORD)
-        page.wait_for_timeout(5000)
+        login.wait_for_login_result(timeout=5000)
         
         # Should be logged in as different user
         current_url = page.url
@@ -106,7 +105,7 @@ class TestEndToEnd:
         dashboard.wait_for_dashboard_load()
         
         # Reload page
-        page.reload(wait_until="networkidle")
+        page.reload(wait_until="domcontentloaded")
         page.wait_for_url("**/dashboard**", timeout=10000)
         
         # Should still be logged in
@@ -114,7 +113,8 @@ class TestEndToEnd:
         assert dashboard_after_reload.is_loaded(), "Should remain logged in after reload"
         
         # Navigate and come back
-        page.goto(page.url, wait_until="networkidle")
+        page.goto(page.url, wait_until="domcontentloaded")
+        wait_for_dashboard_ready(page)
         assert "/dashboard" in page.url, "Should remain logged in after navigation"
     
     def test_error_recovery_workflow(self, page):
@@ -126,7 +126,7 @@ class TestEndToEnd:
         
         # Try wrong password
         login.login(ADMIN_USERNAME, "wrongpassword")
-        page.wait_for_timeout(3000)
+        login.wait_for_login_rejected(timeout=3000)
         
         # Should still be on login or show error
         # Then try correct password
@@ -154,8 +154,8 @@ class TestEndToEnd:
         login.open()
         login.login(username, password)
         
-        # Wait for redirect
-        page.wait_for_timeout(5000)
+        # Wait for redirect or error
+        login.wait_for_login_result(timeout=5000)
         current_url = page.url
         
         # Verify login was successful (not on login page)
@@ -164,12 +164,11 @@ class TestEndToEnd:
             dashboard.wait_for_dashboard_load()
             
             # Interact with dashboard
-            page.wait_for_timeout(2000)
             assert dashboard.is_loaded(), f"Dashboard should work for {username}"
             
             # Logout
             nav = NavigationPage(page)
             nav.logout()
-            page.wait_for_timeout(2000)
+            wait_for_dashboard_exit(page)
 
 
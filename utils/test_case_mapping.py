@@ -54,7 +54,6 @@ TEST_CASE_MAPPING = {
     "test_dashboard_navigation": "TC_DASHBOARD_004",
     "test_dashboard_page_interactions": "TC_DASHBOARD_005",
     "test_dashboard_refresh": "TC_DASHBOARD_006",
-    "test_dashboard_url_direct_access": "TC_DASHBOARD_007",
     "test_dashboard_access_with_both_users": "TC_DASHBOARD_008",
     "test_dashboard_content_loading": "TC_DASHBOARD_009",
     "test_dashboard_responsive_elements": "TC_DASHBOARD_010",
@@ -107,16 +106,16 @@ TEST_CASE_MAPPING = {
     "test_branch_filter_by_location": "TC_BRANCH_004",
     "test_branch_filter_by_status": "TC_BRANCH_005",
     "test_create_branch_button_visible": "TC_BRANCH_006",
-    "test_create_branch_form_elements": "TC_BRANCH_007",
-    "test_fill_branch_form": "TC_BRANCH_008",
     "test_view_branch_functionality": "TC_BRANCH_009",
     "test_edit_branch_functionality": "TC_BRANCH_010",
     "test_branch_table_structure": "TC_BRANCH_011",
     "test_branch_pagination": "TC_BRANCH_012",
     "test_branch_page_refresh": "TC_BRANCH_013",
     "test_branch_direct_url_access": "TC_BRANCH_014",
-    "test_cancel_branch_form": "TC_BRANCH_015",
-    "test_branch_form_validation": "TC_BRANCH_016",
+    "test_branch_form_journey": "TC_BRANCH_017",
+    "test_branch_search_input_visible": "TC_BRANCH_018",
+    "test_branch_location_filter_visible": "TC_BRANCH_019",
+    "test_branch_status_filter_visible": "TC_BRANCH_020",
     
     # Tasks Tests
     "test_tasks_page_loads": "TC_TASKS_001",
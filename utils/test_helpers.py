@@ -1,4 +1,6 @@
 """Test helper utilities for common test operations."""
+import re
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.navigation_page import NavigationPage
@@ -11,6 +13,10 @@ def ensure_fresh_session(page):
     except Exception:
         pass
     
+    # A page that has not navigated yet has no origin storage to clear
+    if page.url == "about:blank":
+        return
+    
     try:
         page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
     except Exception:
@@ -57,4 +63,33 @@ def wait_for_page_ready(page, timeout: int = 30000):
     page.wait_for_load_state("networkidle", timeout=timeout)
     page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
+def wait_for_branches_ready(page, branch, timeout: int = 8000) -> bool:
+    """Wait until the branch list has rendered instead of sleeping a fixed time."""
+    # Card layouts have no table; their rows or the branch heading are enough to know the page is up
+    ready = branch.branches_table_locator.or_(branch.branches_list_locator).or_(
+        page.get_by_role("heading", name=re.compile(r"branch", re.I))
+    )
+    try:
+        page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        ready.first.wait_for(state="visible", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
 
+def wait_for_dashboard_exit(page, timeout: int = 5000):
+    """Wait for the app to leave the dashboard, e.g. after logout, instead of sleeping."""
+    try:
+        page.wait_for_url(lambda url: "/dashboard" not in url, timeout=timeout)
+    except Exception:
+        pass
+
+def wait_for_dashboard_ready(page, timeout: int = 10000) -> bool:
+    """Wait until the dashboard content has rendered instead of waiting for network idle."""
+    dashboard = DashboardPage(page)
+    try:
+        page.wait_for_url("**/dashboard**", timeout=timeout)
+        page.locator(dashboard.content_area).first.wait_for(state="visible", timeout=timeout)
+        return True
+    except Exception:
+        # Layouts without a main landmark still show the dashboard header
+        return dashboard.is_element_visible(dashboard.header, timeout=2000)